@@ -91,7 +91,9 @@ class BaseAPIClient:
             allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PUT", "DELETE"],
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            pool_connections=16, pool_maxsize=32, max_retries=retry_strategy
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
@@ -130,9 +132,9 @@ class BaseAPIClient:
         """Log request details."""
         logger.info(f"API Request: {method} {url}")
         if kwargs.get("params"):
-            logger.debug(f"Query params: {kwargs['params']}")
+            logger.debug("Query params: %s", kwargs["params"])
         if kwargs.get("json"):
-            logger.debug(f"JSON body: {kwargs['json']}")
+            logger.debug("JSON body: %s", kwargs["json"])
 
     def _log_response(self, response: APIResponse) -> None:
         """Log response details."""
@@ -142,7 +144,7 @@ class BaseAPIClient:
             f"({response.elapsed:.2f}s)"
         )
         if response.json_data:
-            logger.debug(f"Response data: {response.json_data}")
+            logger.debug("Response data: %s", response.json_data)
 
     def _handle_response(self, response: requests.Response) -> APIResponse:
         """
@@ -82,6 +82,7 @@ class Settings(BaseSettings):
     baseline_dir: Path = Field(
         default=Path("ui_tests/visual/baselines"), env="BASELINE_DIR"
     )
+    visual_gpu_raster: bool = Field(default=True, env="VISUAL_GPU_RASTER")
 
     # ========================================
     # Security Testing
@@ -123,6 +124,7 @@ class Settings(BaseSettings):
     # ========================================
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
     log_dir: Path = Field(default=Path("logs"), env="LOG_DIR")
+    enable_file_logging: bool = Field(default=True, env="ENABLE_FILE_LOGGING")
     log_file_max_bytes: int = Field(default=10485760, env="LOG_FILE_MAX_BYTES")
     log_backup_count: int = Field(default=5, env="LOG_BACKUP_COUNT")
 
@@ -198,6 +200,19 @@ class Settings(BaseSettings):
             ],
         }
 
+    def get_visual_playwright_config(self) -> Dict[str, Any]:
+        """Get Playwright configuration for visual regression runs."""
+        config = self.get_playwright_config()
+        if self.browser == "chromium" and self.headless and self.visual_gpu_raster:
+            # New headless mode rasterizing through ANGLE/SwiftShader
+            config["args"] = config["args"] + [
+                "--headless=new",
+                "--enable-gpu",
+                "--use-gl=angle",
+                "--use-angle=swiftshader-webgl",
+            ]
+        return config
+
     def get_api_headers(self) -> Dict[str, str]:
         """Get default API headers."""
         return {
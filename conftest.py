@@ -8,7 +8,7 @@ import os
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Generator
+from typing import Any, Dict, Generator
 
 import pytest
 from playwright.sync_api import Browser, BrowserContext, Page, Playwright, sync_playwright
@@ -171,6 +171,57 @@ def page(context: BrowserContext) -> Generator[Page, None, None]:
     page.close()
 
 
+@pytest.fixture(scope="session")
+def warm_storage_state(browser: Browser) -> Dict[str, Any]:
+    """
+    Storage state (cookies + localStorage) captured once after loading the site.
+
+    Args:
+        browser: Browser instance
+
+    Returns:
+        Storage state dict for ``browser.new_context(storage_state=...)``
+    """
+    warm_context = browser.new_context(viewport=settings.get_browser_dimensions())
+    warm_page = warm_context.new_page()
+    warm_page.goto(settings.base_url, wait_until="domcontentloaded")
+    warm_page.wait_for_selector(".card", timeout=settings.default_timeout)
+    state = warm_context.storage_state()
+    warm_context.close()
+    logger.info("Captured warm storage state")
+    return state
+
+
+@pytest.fixture
+def warm_page(
+    browser: Browser, warm_storage_state: Dict[str, Any]
+) -> Generator[Page, None, None]:
+    """
+    Function-scoped page whose context starts from the warmed storage state.
+
+    Every test using it shares the same site cookies (including DemoBlaze's
+    anonymous cart id), so only use it where the assertion does not depend
+    on a fresh session.
+
+    Args:
+        browser: Browser instance
+        warm_storage_state: Session storage state
+
+    Yields:
+        Page instance
+    """
+    warm_context = browser.new_context(
+        viewport=settings.get_browser_dimensions(), storage_state=warm_storage_state
+    )
+    page = warm_context.new_page()
+    page.set_default_timeout(settings.default_timeout)
+    page.set_default_navigation_timeout(settings.navigation_timeout)
+
+    yield page
+
+    warm_context.close()
+
+
 # ========================================
 # Screenshot Fixtures
 # ========================================
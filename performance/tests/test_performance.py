@@ -29,9 +29,9 @@ class TestAPIPerformance:
     @pytest.mark.api
     def test_products_api_response_time(self, api_client):
         """Test products API responds within threshold."""
-        start = time.time()
+        start = time.perf_counter()
         response = api_client.get_products()
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
 
         assert response.is_success()
         assert elapsed < 2.0, f"API took {elapsed:.2f}s (threshold: 2.0s)"
@@ -43,9 +43,9 @@ class TestAPIPerformance:
         times = []
 
         for _ in range(10):
-            start = time.time()
+            start = time.perf_counter()
             response = api_client.get_products()
-            elapsed = time.time() - start
+            elapsed = time.perf_counter() - start
             times.append(elapsed)
             assert response.is_success()
 
@@ -61,9 +61,9 @@ class TestAPIPerformance:
         username = f"perftest_{uuid.uuid4().hex[:8]}"
         api_client.signup(username, "Password123")
 
-        start = time.time()
+        start = time.perf_counter()
         response = api_client.login(username, "Password123")
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
 
         assert response.is_success()
         assert elapsed < 2.0, f"Login took {elapsed:.2f}s"
@@ -76,9 +76,9 @@ class TestAPIPerformance:
         cookie = f"perftest_{uuid.uuid4().hex}"
 
         # Add to cart
-        start = time.time()
+        start = time.perf_counter()
         response = api_client.add_to_cart(1, cookie)
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
 
         assert response.is_success()
         assert elapsed < 2.0, f"Add to cart took {elapsed:.2f}s"
@@ -91,11 +91,11 @@ class TestAPIPerformance:
             response = api_client.get_products()
             return response.is_success()
 
-        start = time.time()
+        start = time.perf_counter()
         with ThreadPoolExecutor(max_workers=10) as executor:
             futures = [executor.submit(make_request) for _ in range(20)]
             results = [f.result() for f in as_completed(futures)]
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
 
         assert all(results), "Some requests failed"
         assert elapsed < 10.0, f"20 concurrent requests took {elapsed:.2f}s"
@@ -111,9 +111,9 @@ class TestResponseTimeConsistency:
         times = []
 
         for _ in range(10):
-            start = time.time()
+            start = time.perf_counter()
             api_client.get_products()
-            elapsed = time.time() - start
+            elapsed = time.perf_counter() - start
             times.append(elapsed)
 
         avg = sum(times) / len(times)
@@ -132,17 +132,17 @@ class TestResponseTimeConsistency:
 
         # First batch
         for _ in range(5):
-            start = time.time()
+            start = time.perf_counter()
             api_client.get_products()
-            first_batch.append(time.time() - start)
+            first_batch.append(time.perf_counter() - start)
 
         time.sleep(1)
 
         # Second batch
         for _ in range(5):
-            start = time.time()
+            start = time.perf_counter()
             api_client.get_products()
-            second_batch.append(time.time() - start)
+            second_batch.append(time.perf_counter() - start)
 
         avg_first = sum(first_batch) / len(first_batch)
         avg_second = sum(second_batch) / len(second_batch)
@@ -160,13 +160,13 @@ class TestThroughput:
     def test_requests_per_second(self, api_client):
         """Test API can handle minimum requests per second."""
         request_count = 20
-        start = time.time()
+        start = time.perf_counter()
 
         for _ in range(request_count):
             response = api_client.get_products()
             assert response.is_success()
 
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         rps = request_count / elapsed
 
         assert rps >= 5, f"Only {rps:.2f} req/s (target: 5)"
@@ -179,11 +179,11 @@ class TestThroughput:
             for _ in range(5):
                 api_client.get_products()
 
-        start = time.time()
+        start = time.perf_counter()
         with ThreadPoolExecutor(max_workers=5) as executor:
             futures = [executor.submit(rapid_requests) for _ in range(5)]
             [f.result() for f in as_completed(futures)]
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
 
         # 25 total requests should complete in reasonable time
         assert elapsed < 15.0, f"Burst took {elapsed:.2f}s"
@@ -199,9 +199,9 @@ class TestEndpointPerformance:
         import uuid
         username = f"perftest_{uuid.uuid4().hex[:8]}"
 
-        start = time.time()
+        start = time.perf_counter()
         response = api_client.signup(username, "Password123")
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
 
         assert response.is_success()
         assert elapsed < 2.0
@@ -213,9 +213,9 @@ class TestEndpointPerformance:
         import uuid
         cookie = f"perftest_{uuid.uuid4().hex}"
 
-        start = time.time()
+        start = time.perf_counter()
         response = api_client.get_cart(cookie)
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
 
         assert response.is_success()
         assert elapsed < 2.0
@@ -230,7 +230,7 @@ class TestEndpointPerformance:
         # Add item first
         api_client.add_to_cart(1, cookie)
 
-        start = time.time()
+        start = time.perf_counter()
         response = api_client.place_order(
             cookie=cookie,
             name="Perf Test",
@@ -241,7 +241,7 @@ class TestEndpointPerformance:
             year="2025",
             total=790
         )
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
 
         assert response.is_success()
         assert elapsed < 3.0  # Order might take slightly longer
@@ -258,7 +258,7 @@ class TestLoadScenarios:
         username = f"perftest_{uuid.uuid4().hex[:8]}"
         cookie = uuid.uuid4().hex
 
-        start = time.time()
+        start = time.perf_counter()
 
         # Signup
         api_client.signup(username, "Password123")
@@ -287,7 +287,7 @@ class TestLoadScenarios:
             total=790
         )
 
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
 
         # Complete journey should be under 15 seconds
         assert elapsed < 15.0, f"Journey took {elapsed:.2f}s"
@@ -299,9 +299,9 @@ class TestLoadScenarios:
         times = []
 
         for i in range(10):
-            start = time.time()
+            start = time.perf_counter()
             response = api_client.get_products()
-            elapsed = time.time() - start
+            elapsed = time.perf_counter() - start
             times.append(elapsed)
             assert response.is_success()
 
@@ -322,9 +322,9 @@ class TestPerformanceMetrics:
         times = []
 
         for _ in range(20):
-            start = time.time()
+            start = time.perf_counter()
             api_client.get_products()
-            times.append(time.time() - start)
+            times.append(time.perf_counter() - start)
 
         times.sort()
         p95 = times[int(len(times) * 0.95)]
@@ -338,9 +338,9 @@ class TestPerformanceMetrics:
         times = []
 
         for _ in range(20):
-            start = time.time()
+            start = time.perf_counter()
             api_client.get_products()
-            times.append(time.time() - start)
+            times.append(time.perf_counter() - start)
 
         times.sort()
         p99 = times[int(len(times) * 0.99)]
@@ -5,17 +5,30 @@ Tests for XSS, SQL injection, authentication, session management,
 security headers, and other common vulnerabilities.
 """
 
+import itertools
+import os
 import re
 import uuid
 
 import pytest
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from api_tests.clients.demoblaze_client import DemoBlazeAPIClient
 from config.settings import settings
 
+# Random per run (one urandom read); the counter keeps suffixes unique within it
+_RUN_PREFIX = os.urandom(4).hex()
+_suffix_counter = itertools.count()
 
-@pytest.fixture
+
+def _unique_suffix() -> str:
+    """Return a username suffix unique to this test run."""
+    return f"{_RUN_PREFIX}{next(_suffix_counter):x}"
+
+
+@pytest.fixture(scope="module")
 def api_client():
     """Create API client for security testing."""
     client = DemoBlazeAPIClient()
@@ -23,67 +36,103 @@ def api_client():
     client.close()
 
 
+@pytest.fixture(scope="module")
+def prepared_user(api_client):
+    """Sign up a single throwaway user shared by the tests in this module."""
+    username = f"test_{_unique_suffix()}"
+    password = "UniquePassword12345"
+    response = api_client.signup(username, password)
+    return {"username": username, "password": password, "signup_response": response}
+
+
 @pytest.fixture
 def session():
     """Create requests session."""
     s = requests.Session()
+
+    # Retry transient gateway errors on idempotent probes instead of failing the test
+    retry_strategy = Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD", "OPTIONS"]),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry_strategy)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+
     yield s
     s.close()
 
 
+def _head(session, url):
+    """Fetch response headers only, falling back to GET if HEAD is not allowed."""
+    response = session.head(url, allow_redirects=False)
+    if response.status_code == 405:
+        # Stream so the body is never downloaded; headers are all we need
+        response = session.get(url, allow_redirects=False, stream=True)
+        response.close()
+    return response
+
+
+_SAFE_STATUS_CODES = (200, 400, 500)
+
+
+def _assert_safe_response(response, allowed=_SAFE_STATUS_CODES):
+    """Assert the server handled a hostile request without an unexpected status."""
+    assert response.status_code in allowed, (
+        f"Unexpected status {response.status_code} for {response.url}"
+    )
+
+
 class TestInjectionVulnerabilities:
     """Test for injection vulnerabilities (OWASP A03)."""
 
     @pytest.mark.security
     @pytest.mark.api
-    def test_sql_injection_in_login(self, api_client):
+    @pytest.mark.parametrize("payload", [
+        "admin' OR '1'='1",
+        "admin'--",
+        "admin' OR 1=1--",
+        "' OR ''='",
+        "1' OR '1' = '1",
+    ])
+    def test_sql_injection_in_login(self, api_client, payload):
         """Test SQL injection attempts in login."""
-        payloads = [
-            "admin' OR '1'='1",
-            "admin'--",
-            "admin' OR 1=1--",
-            "' OR ''='",
-            "1' OR '1' = '1",
-        ]
-
-        for payload in payloads:
-            response = api_client.login(payload, "password")
-            # Should not succeed with SQL injection
-            assert not response.is_success(), f"SQL injection worked: {payload}"
+        response = api_client.login(payload, "password")
+        # Should not succeed with SQL injection
+        assert not response.is_success(), f"SQL injection worked: {payload}"
 
     @pytest.mark.security
     @pytest.mark.api
-    def test_sql_injection_in_signup(self, api_client):
+    @pytest.mark.parametrize("payload", [
+        "'; DROP TABLE users; --",
+        "admin' OR '1'='1",
+        "1' UNION SELECT NULL--",
+    ])
+    def test_sql_injection_in_signup(self, api_client, payload):
         """Test SQL injection attempts in signup."""
-        payloads = [
-            "'; DROP TABLE users; --",
-            "admin' OR '1'='1",
-            "1' UNION SELECT NULL--",
-        ]
-
-        for payload in payloads:
-            response = api_client.signup(payload, "password")
-            # Should handle safely (either succeed or fail gracefully)
-            assert response.status_code in [200, 400, 500]
+        response = api_client.signup(payload, "password")
+        # Should handle safely (either succeed or fail gracefully)
+        _assert_safe_response(response)
 
     @pytest.mark.security
     @pytest.mark.api
-    def test_xss_in_user_input(self, api_client):
+    @pytest.mark.parametrize("payload", [
+        "<script>alert('XSS')</script>",
+        "<img src=x onerror=alert('XSS')>",
+        "javascript:alert('XSS')",
+        "<svg onload=alert('XSS')>",
+    ])
+    def test_xss_in_user_input(self, api_client, payload):
         """Test XSS payload handling."""
-        xss_payloads = [
-            "<script>alert('XSS')</script>",
-            "<img src=x onerror=alert('XSS')>",
-            "javascript:alert('XSS')",
-            "<svg onload=alert('XSS')>",
-        ]
-
-        for payload in xss_payloads:
-            username = f"test_{uuid.uuid4().hex[:8]}"
-            response = api_client.signup(username, payload)
-            # Should sanitize or reject
-            if response.is_success():
-                # If accepted, verify no script execution in response
-                assert "<script>" not in response.json_data.get("errorMessage", "")
+        username = f"test_{_unique_suffix()}"
+        response = api_client.signup(username, payload)
+        # Should sanitize or reject
+        if response.is_success():
+            # If accepted, verify no script execution in response
+            assert "<script>" not in response.json_data.get("errorMessage", "")
 
 
 class TestAuthenticationSecurity:
@@ -91,15 +140,13 @@ class TestAuthenticationSecurity:
 
     @pytest.mark.security
     @pytest.mark.api
-    def test_weak_password_acceptance(self, api_client):
+    @pytest.mark.parametrize("weak_pwd", ["123", "a", "password"])
+    def test_weak_password_acceptance(self, api_client, weak_pwd):
         """Test if system accepts weak passwords."""
-        weak_passwords = ["123", "a", "password"]
-
-        for weak_pwd in weak_passwords:
-            username = f"test_{uuid.uuid4().hex[:8]}"
-            response = api_client.signup(username, weak_pwd)
-            # Note: DemoBlaze accepts any password (this is a finding)
-            # In production, should reject weak passwords
+        username = f"test_{_unique_suffix()}"
+        response = api_client.signup(username, weak_pwd)
+        # Note: DemoBlaze accepts any password (this is a finding)
+        # In production, should reject weak passwords
 
     @pytest.mark.security
     @pytest.mark.api
@@ -121,7 +168,7 @@ class TestAuthenticationSecurity:
         tokens = set()
 
         for _ in range(5):
-            username = f"test_{uuid.uuid4().hex[:8]}"
+            username = f"test_{_unique_suffix()}"
             api_client.signup(username, "Password123")
             response = api_client.login(username, "Password123")
 
@@ -135,16 +182,12 @@ class TestAuthenticationSecurity:
 
     @pytest.mark.security
     @pytest.mark.api
-    def test_password_in_response(self, api_client):
+    def test_password_in_response(self, prepared_user):
         """Test that passwords are never exposed in responses."""
-        username = f"test_{uuid.uuid4().hex[:8]}"
-        password = "SecretPassword123"
-
-        response = api_client.signup(username, password)
-        response_text = str(response.raw_response.text).lower()
+        response_text = str(prepared_user["signup_response"].text).lower()
 
         # Password should never appear in response
-        assert password.lower() not in response_text
+        assert prepared_user["password"].lower() not in response_text
 
 
 class TestSecurityHeaders:
@@ -153,7 +196,7 @@ class TestSecurityHeaders:
     @pytest.mark.security
     def test_security_headers_present(self, session):
         """Test that security headers are present."""
-        response = session.get("https://www.demoblaze.com")
+        response = _head(session, "https://www.demoblaze.com")
 
         # Check for important security headers
         headers = response.headers
@@ -183,7 +226,8 @@ class TestSecurityHeaders:
         """Test CORS headers are properly configured."""
         response = session.options(
             "https://api.demoblaze.com/entries",
-            headers={"Origin": "https://evil.com"}
+            headers={"Origin": "https://evil.com"},
+            allow_redirects=False,
         )
 
         # Check CORS headers
@@ -196,21 +240,19 @@ class TestInputValidation:
 
     @pytest.mark.security
     @pytest.mark.api
-    def test_special_characters_handling(self, api_client):
+    @pytest.mark.parametrize("chars", [
+        "'; DROP TABLE--",
+        "<script>alert('xss')</script>",
+        "../../../../etc/passwd",
+        "%00",
+        "\x00",
+    ])
+    def test_special_characters_handling(self, api_client, chars):
         """Test handling of special characters."""
-        special_chars = [
-            "'; DROP TABLE--",
-            "<script>alert('xss')</script>",
-            "../../../../etc/passwd",
-            "%00",
-            "\x00",
-        ]
-
-        for chars in special_chars:
-            username = f"test_{chars}_{uuid.uuid4().hex[:4]}"
-            response = api_client.signup(username[:50], "Password123")
-            # Should handle safely
-            assert response.status_code in [200, 400, 500]
+        username = f"test_{chars}_{_unique_suffix()}"
+        response = api_client.signup(username[:50], "Password123")
+        # Should handle safely
+        _assert_safe_response(response)
 
     @pytest.mark.security
     @pytest.mark.api
@@ -221,7 +263,7 @@ class TestInputValidation:
         # Try adding with huge product ID
         response = api_client.add_to_cart(999999999999, cookie)
         # Should handle gracefully
-        assert response.status_code in [200, 400, 404, 500]
+        _assert_safe_response(response, allowed=(*_SAFE_STATUS_CODES, 404))
 
     @pytest.mark.security
     @pytest.mark.api
@@ -232,7 +274,7 @@ class TestInputValidation:
         # Try negative product ID
         response = api_client.add_to_cart(-1, cookie)
         # Should reject or handle safely
-        assert response.status_code in [200, 400, 404]
+        _assert_safe_response(response, allowed=(200, 400, 404))
 
 
 class TestAuthorizationSecurity:
@@ -246,7 +288,7 @@ class TestAuthorizationSecurity:
         response = api_client.get_cart("")
 
         # Should reject or return empty
-        assert response.status_code in [200, 401, 403]
+        _assert_safe_response(response, allowed=(200, 401, 403))
 
     @pytest.mark.security
     @pytest.mark.api
@@ -268,13 +310,8 @@ class TestCryptographicSecurity:
 
     @pytest.mark.security
     @pytest.mark.api
-    def test_password_not_stored_plaintext(self, api_client):
+    def test_password_not_stored_plaintext(self, prepared_user):
         """Test that passwords are not stored in plaintext."""
-        username = f"test_{uuid.uuid4().hex[:8]}"
-        password = "UniquePassword12345"
-
-        api_client.signup(username, password)
-
         # Try to detect if password is visible anywhere
         # This is a limited test - proper test needs DB access
 
@@ -325,7 +362,8 @@ class TestAPISecurityMisconfigurations:
         ]
 
         for path in paths:
-            response = session.get(f"https://www.demoblaze.com{path}")
-            # Should not show directory listing
-            if response.status_code == 200:
-                assert "Index of" not in response.text
+            # Stream so the body is only downloaded when there is a listing to inspect
+            with session.get(f"https://www.demoblaze.com{path}", stream=True) as response:
+                # Should not show directory listing
+                if response.status_code == 200:
+                    assert "Index of" not in response.text
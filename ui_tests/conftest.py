@@ -0,0 +1,220 @@
+"""
+UI test fixtures.
+
+Provides page object fixtures shared by the UI test suites and writes
+per-test results to ``results.jsonl`` as the run progresses.
+"""
+
+import json
+import os
+from types import SimpleNamespace
+from typing import Any, Dict, Generator
+
+import pytest
+from playwright.sync_api import Browser, Page, Route
+
+from config.settings import settings
+from ui_tests.fixtures.catalog import bycat_response
+from ui_tests.pages.cart_page import CartPage
+from ui_tests.pages.home_page import HomePage
+from ui_tests.pages.login_page import LoginPage
+from ui_tests.pages.product_detail_page import ProductDetailPage
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+RESULTS_FILE = settings.report_dir / "results.jsonl"
+
+
+# ========================================
+# Progressive Results
+# ========================================
+
+
+def _append_result(entry: Dict[str, Any]) -> None:
+    """
+    Append one test result to the results file as a single JSON line.
+
+    Each record is one ``write`` on an ``O_APPEND`` descriptor, so parallel
+    xdist workers add whole lines without a lock and without rewriting
+    earlier results.
+
+    Args:
+        entry: Result record to append
+    """
+    RESULTS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    line = (json.dumps(entry) + "\n").encode()
+    fd = os.open(str(RESULTS_FILE), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+
+
+def pytest_configure(config):
+    """Start each run with an empty results file (controller process only)."""
+    if not hasattr(config, "workerinput"):
+        RESULTS_FILE.unlink(missing_ok=True)
+
+
+def pytest_runtest_logreport(report):
+    """Record the outcome of each test as soon as it is known."""
+    if report.when != "call" and report.passed:
+        return
+    if getattr(report, "node", None) is not None:
+        # xdist controller replaying a worker's report; the worker wrote it
+        return
+    _append_result(
+        {
+            "nodeid": report.nodeid,
+            "outcome": report.outcome,
+            "when": report.when,
+            "duration": round(report.duration, 3),
+        }
+    )
+
+
+# ========================================
+# Page Object Fixtures
+# ========================================
+
+
+@pytest.fixture
+def pages(page: Page) -> SimpleNamespace:
+    """
+    Page objects bound to the test's page.
+
+    The objects live for the whole test, so their cached Locators are
+    reused across every call the test makes.
+
+    Args:
+        page: Playwright page instance
+
+    Returns:
+        Namespace with ``home``, ``product`` and ``cart`` page objects
+    """
+    return SimpleNamespace(
+        home=HomePage(page),
+        product=ProductDetailPage(page),
+        cart=CartPage(page),
+    )
+
+
+@pytest.fixture
+def login_modal_open(warm_page: Page) -> LoginPage:
+    """
+    Login page object with the login modal already open.
+
+    Starts from the warmed storage state, so use it only for tests that
+    exercise the modal itself rather than a fresh session.
+
+    Args:
+        warm_page: Page created from the session storage state
+
+    Returns:
+        LoginPage bound to the page, with the login modal visible
+    """
+    HomePage(warm_page).open()
+    return LoginPage(warm_page).open_login_modal()
+
+
+@pytest.fixture
+def mock_category_api(page: Page) -> None:
+    """
+    Serve category filter requests from canned catalogue data.
+
+    Intercepts the site's ``POST /bycat`` call so category tests that only
+    check the grid re-renders skip the backend round trip.
+
+    Args:
+        page: Playwright page instance
+    """
+
+    def fulfill_bycat(route: Route) -> None:
+        category = (route.request.post_data_json or {}).get("cat", "")
+        route.fulfill(
+            status=200,
+            content_type="application/json",
+            headers={"Access-Control-Allow-Origin": "*"},
+            body=json.dumps(bycat_response(category)),
+        )
+
+    page.route(f"{settings.api_base_url}/bycat", fulfill_bycat)
+
+
+@pytest.fixture(scope="session")
+def first_product_path(browser: Browser) -> str:
+    """
+    Link to the first product in the default listing, looked up once.
+
+    Args:
+        browser: Browser instance
+
+    Returns:
+        Product URL relative to the base URL
+    """
+    lookup_context = browser.new_context()
+    try:
+        path = HomePage(lookup_context.new_page()).open().get_product_path(0)
+    finally:
+        lookup_context.close()
+    logger.info(f"First product path: {path}")
+    return path
+
+
+@pytest.fixture
+def product_page(page: Page, first_product_path: str) -> ProductDetailPage:
+    """
+    Product detail page for the first product, opened by direct URL.
+
+    Skips the home page load and product click that tests of the product
+    page itself don't need.
+
+    Args:
+        page: Playwright page instance
+        first_product_path: Link to the first product
+
+    Returns:
+        ProductDetailPage with the product details rendered
+    """
+    return ProductDetailPage(page).open(first_product_path)
+
+
+@pytest.fixture(scope="class")
+def shared_home_page(browser: Browser) -> Generator[Page, None, None]:
+    """
+    One page per test class, so the home page is loaded once per class.
+
+    Args:
+        browser: Browser instance
+
+    Yields:
+        Page instance shared by every test in the class
+    """
+    shared_context = browser.new_context(viewport=settings.get_browser_dimensions())
+    page = shared_context.new_page()
+    page.set_default_timeout(settings.default_timeout)
+    page.set_default_navigation_timeout(settings.navigation_timeout)
+
+    yield page
+
+    shared_context.close()
+
+
+@pytest.fixture
+def home(shared_home_page: Page) -> Generator[HomePage, None, None]:
+    """
+    Home page on the class-shared page, reset after each test.
+
+    ``open()`` only reloads if an earlier test navigated away, and any modal
+    a test left open is dismissed on teardown.
+
+    Args:
+        shared_home_page: Page shared by the test class
+
+    Yields:
+        HomePage on the home page
+    """
+    home_page = HomePage(shared_home_page).open()
+    yield home_page
+    home_page.close_open_modals()
@@ -0,0 +1,70 @@
+"""
+Canned DemoBlaze catalogue data for UI tests that mock the product API.
+
+Items follow the shape returned by ``POST /bycat`` so the site's own
+rendering code can display them unchanged.
+"""
+
+from typing import Any, Dict, List
+
+CATEGORY_PRODUCTS: Dict[str, List[Dict[str, Any]]] = {
+    "phone": [
+        {
+            "id": 1,
+            "cat": "phone",
+            "title": "Samsung galaxy s6",
+            "price": 360.0,
+            "img": "imgs/galaxy_s6.jpg",
+            "desc": "Mock phone listing.",
+        },
+        {
+            "id": 2,
+            "cat": "phone",
+            "title": "Nokia lumia 1520",
+            "price": 820.0,
+            "img": "imgs/Lumia_1520.jpg",
+            "desc": "Mock phone listing.",
+        },
+    ],
+    "notebook": [
+        {
+            "id": 8,
+            "cat": "notebook",
+            "title": "Sony vaio i5",
+            "price": 790.0,
+            "img": "imgs/sony_vaio_5.jpg",
+            "desc": "Mock laptop listing.",
+        },
+        {
+            "id": 9,
+            "cat": "notebook",
+            "title": "Sony vaio i7",
+            "price": 790.0,
+            "img": "imgs/sony_vaio_5.jpg",
+            "desc": "Mock laptop listing.",
+        },
+    ],
+    "monitor": [
+        {
+            "id": 10,
+            "cat": "monitor",
+            "title": "Apple monitor 24",
+            "price": 400.0,
+            "img": "imgs/apple_cinema.jpg",
+            "desc": "Mock monitor listing.",
+        },
+    ],
+}
+
+
+def bycat_response(category: str) -> Dict[str, Any]:
+    """
+    Build a ``/bycat`` response body for a category.
+
+    Args:
+        category: DemoBlaze category key (phone, notebook, monitor)
+
+    Returns:
+        Response body with the category's canned items
+    """
+    return {"Items": CATEGORY_PRODUCTS.get(category, [])}
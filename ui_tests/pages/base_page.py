@@ -5,9 +5,10 @@ Provides common functionality for all page objects including
 element interactions, waits, and utility methods.
 """
 
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
-from playwright.sync_api import Page, expect
+from playwright.sync_api import Locator, Page, expect
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from config.settings import settings
 from utils.logger import get_logger
@@ -28,6 +29,46 @@ class BasePage:
         self.page = page
         self.base_url = settings.base_url
         self.timeout = settings.default_timeout
+        self._loc_cache: Dict[str, Locator] = {}
+        self._login_cache: Optional[Tuple[bool, Optional[str]]] = None
+
+    def _resolve_timeout(self, timeout: Optional[int]) -> int:
+        """
+        Resolve an optional per-call timeout against the page default.
+
+        An explicit ``0`` is honoured (Playwright's "no wait") rather than
+        being replaced by the default as a falsy value would be.
+
+        Args:
+            timeout: Optional custom timeout in milliseconds
+
+        Returns:
+            Timeout to pass to Playwright
+        """
+        return self.timeout if timeout is None else timeout
+
+    def locator(self, selector: str) -> Locator:
+        """
+        Get a cached Locator for a selector.
+
+        Locators are lazy, so a cached instance always re-queries the DOM
+        when used and stays valid across navigations; caching only skips
+        rebuilding the handle.
+
+        Args:
+            selector: Element selector
+
+        Returns:
+            Locator for the selector
+        """
+        loc = self._loc_cache.get(selector)
+        if loc is None:
+            loc = self._loc_cache[selector] = self.page.locator(selector)
+        return loc
+
+    def _reset_page_state(self) -> None:
+        """Drop state cached from the current document; called on every navigation."""
+        self._login_cache = None
 
     # ========================================
     # Navigation Methods
@@ -42,6 +83,7 @@ class BasePage:
         """
         url = f"{self.base_url}/{path.lstrip('/')}" if path else self.base_url
         logger.info(f"Navigating to: {url}")
+        self._reset_page_state()
         self.page.goto(url, wait_until="domcontentloaded")
 
     def get_current_url(self) -> str:
@@ -55,14 +97,17 @@ class BasePage:
     def refresh(self) -> None:
         """Refresh the current page."""
         logger.info("Refreshing page")
+        self._reset_page_state()
         self.page.reload(wait_until="domcontentloaded")
 
     def go_back(self) -> None:
         """Navigate back in browser history."""
+        self._reset_page_state()
         self.page.go_back(wait_until="domcontentloaded")
 
     def go_forward(self) -> None:
         """Navigate forward in browser history."""
+        self._reset_page_state()
         self.page.go_forward(wait_until="domcontentloaded")
 
     # ========================================
@@ -77,8 +122,8 @@ class BasePage:
             selector: Element selector
             timeout: Optional custom timeout
         """
-        logger.debug(f"Clicking element: {selector}")
-        self.page.click(selector, timeout=timeout or self.timeout)
+        logger.debug("Clicking element: %s", selector)
+        self.page.click(selector, timeout=self._resolve_timeout(timeout))
 
     def fill(self, selector: str, text: str, timeout: Optional[int] = None) -> None:
         """
@@ -89,8 +134,33 @@ class BasePage:
             text: Text to fill
             timeout: Optional custom timeout
         """
-        logger.debug(f"Filling '{selector}' with text")
-        self.page.fill(selector, text, timeout=timeout or self.timeout)
+        logger.debug("Filling '%s' with text", selector)
+        self.page.fill(selector, text, timeout=self._resolve_timeout(timeout))
+
+    def fill_fields(self, values: Dict[str, str]) -> None:
+        """
+        Fill several inputs in a single browser round trip.
+
+        Sets each value and dispatches ``input``/``change`` events in page
+        context. Unlike fill(), this does not wait for actionability, so use
+        it only once the form is known to be visible.
+
+        Args:
+            values: Mapping of element selector to text
+        """
+        logger.debug("Filling %d fields", len(values))
+        self.page.evaluate(
+            """(fields) => {
+                for (const [selector, value] of fields) {
+                    const el = document.querySelector(selector);
+                    if (!el) throw new Error(`No element matches ${selector}`);
+                    el.value = value;
+                    el.dispatchEvent(new Event("input", { bubbles: true }));
+                    el.dispatchEvent(new Event("change", { bubbles: true }));
+                }
+            }""",
+            list(values.items()),
+        )
 
     def type_text(
         self, selector: str, text: str, delay: int = 50, timeout: Optional[int] = None
@@ -104,8 +174,8 @@ class BasePage:
             delay: Delay between keystrokes in ms
             timeout: Optional custom timeout
         """
-        logger.debug(f"Typing text into '{selector}'")
-        self.page.type(selector, text, delay=delay, timeout=timeout or self.timeout)
+        logger.debug("Typing text into '%s'", selector)
+        self.page.type(selector, text, delay=delay, timeout=self._resolve_timeout(timeout))
 
     def select_option(
         self, selector: str, value: str, timeout: Optional[int] = None
@@ -118,8 +188,8 @@ class BasePage:
             value: Option value to select
             timeout: Optional custom timeout
         """
-        logger.debug(f"Selecting option '{value}' from '{selector}'")
-        self.page.select_option(selector, value, timeout=timeout or self.timeout)
+        logger.debug("Selecting option '%s' from '%s'", value, selector)
+        self.page.select_option(selector, value, timeout=self._resolve_timeout(timeout))
 
     def check(self, selector: str, timeout: Optional[int] = None) -> None:
         """
@@ -129,8 +199,8 @@ class BasePage:
             selector: Checkbox selector
             timeout: Optional custom timeout
         """
-        logger.debug(f"Checking checkbox: {selector}")
-        self.page.check(selector, timeout=timeout or self.timeout)
+        logger.debug("Checking checkbox: %s", selector)
+        self.page.check(selector, timeout=self._resolve_timeout(timeout))
 
     def uncheck(self, selector: str, timeout: Optional[int] = None) -> None:
         """
@@ -140,8 +210,8 @@ class BasePage:
             selector: Checkbox selector
             timeout: Optional custom timeout
         """
-        logger.debug(f"Unchecking checkbox: {selector}")
-        self.page.uncheck(selector, timeout=timeout or self.timeout)
+        logger.debug("Unchecking checkbox: %s", selector)
+        self.page.uncheck(selector, timeout=self._resolve_timeout(timeout))
 
     def hover(self, selector: str, timeout: Optional[int] = None) -> None:
         """
@@ -151,8 +221,8 @@ class BasePage:
             selector: Element selector
             timeout: Optional custom timeout
         """
-        logger.debug(f"Hovering over: {selector}")
-        self.page.hover(selector, timeout=timeout or self.timeout)
+        logger.debug("Hovering over: %s", selector)
+        self.page.hover(selector, timeout=self._resolve_timeout(timeout))
 
     def double_click(self, selector: str, timeout: Optional[int] = None) -> None:
         """
@@ -162,8 +232,8 @@ class BasePage:
             selector: Element selector
             timeout: Optional custom timeout
         """
-        logger.debug(f"Double-clicking: {selector}")
-        self.page.dblclick(selector, timeout=timeout or self.timeout)
+        logger.debug("Double-clicking: %s", selector)
+        self.page.dblclick(selector, timeout=self._resolve_timeout(timeout))
 
     # ========================================
     # Element Query Methods
@@ -180,8 +250,8 @@ class BasePage:
         Returns:
             Element text content
         """
-        element = self.page.locator(selector)
-        element.wait_for(state="visible", timeout=timeout or self.timeout)
+        element = self.locator(selector)
+        element.wait_for(state="visible", timeout=self._resolve_timeout(timeout))
         return element.inner_text()
 
     def get_attribute(
@@ -198,8 +268,8 @@ class BasePage:
         Returns:
             Attribute value or None
         """
-        element = self.page.locator(selector)
-        element.wait_for(state="attached", timeout=timeout or self.timeout)
+        element = self.locator(selector)
+        element.wait_for(state="attached", timeout=self._resolve_timeout(timeout))
         return element.get_attribute(attribute)
 
     def get_value(self, selector: str, timeout: Optional[int] = None) -> str:
@@ -215,38 +285,106 @@ class BasePage:
         """
         return self.get_attribute(selector, "value", timeout) or ""
 
-    def is_visible(self, selector: str, timeout: int = 5000) -> bool:
+    def is_visible(self, selector: str, timeout: int = 0) -> bool:
         """
         Check if element is visible.
 
         Args:
             selector: Element selector
-            timeout: Timeout in milliseconds
+            timeout: Timeout in milliseconds; 0 checks the current state without waiting
 
         Returns:
             True if visible, False otherwise
         """
+        if timeout:
+            return self.wait_until_visible(selector, timeout)
+        return self.locator(selector).is_visible()
+
+    def is_hidden(self, selector: str, timeout: int = 0) -> bool:
+        """
+        Check if element is hidden or absent.
+
+        Args:
+            selector: Element selector
+            timeout: Timeout in milliseconds; 0 checks the current state without waiting
+
+        Returns:
+            True if hidden, False otherwise
+        """
+        if timeout:
+            return self.wait_until_hidden(selector, timeout)
+        return self.locator(selector).is_hidden()
+
+    def get_visibility(self, selectors: Dict[str, str]) -> Dict[str, bool]:
+        """
+        Check visibility of several elements in a single browser round trip.
+
+        Uses the same rule as Playwright's ``is_visible``: the first match
+        has a non-empty box and is not ``visibility: hidden``.
+
+        Args:
+            selectors: Mapping of result key to element selector
+
+        Returns:
+            Mapping of result key to visibility
+        """
+        return self.page.evaluate(
+            """(selectors) => Object.fromEntries(
+                Object.entries(selectors).map(([key, selector]) => {
+                    const el = document.querySelector(selector);
+                    const visible = !!el && el.getClientRects().length > 0
+                        && getComputedStyle(el).visibility !== "hidden";
+                    return [key, visible];
+                })
+            )""",
+            selectors,
+        )
+
+    def get_hidden_elements(self, selectors: List[str]) -> List[str]:
+        """
+        List which of several elements are not visible, in one round trip.
+
+        Args:
+            selectors: Element selectors (plain CSS)
+
+        Returns:
+            Selectors that are hidden or missing; empty if all are visible
+        """
+        visibility = self.get_visibility({selector: selector for selector in selectors})
+        return [selector for selector in selectors if not visibility[selector]]
+
+    def wait_until_visible(self, selector: str, timeout: int = 5000) -> bool:
+        """
+        Wait for element to become visible.
+
+        Args:
+            selector: Element selector
+            timeout: Timeout in milliseconds
+
+        Returns:
+            True if visible within timeout, False otherwise
+        """
         try:
-            self.page.locator(selector).wait_for(state="visible", timeout=timeout)
+            self.locator(selector).wait_for(state="visible", timeout=timeout)
             return True
-        except Exception:
+        except PlaywrightTimeoutError:
             return False
 
-    def is_hidden(self, selector: str, timeout: int = 5000) -> bool:
+    def wait_until_hidden(self, selector: str, timeout: int = 5000) -> bool:
         """
-        Check if element is hidden.
+        Wait for element to become hidden.
 
         Args:
             selector: Element selector
             timeout: Timeout in milliseconds
 
         Returns:
-            True if hidden, False otherwise
+            True if hidden within timeout, False otherwise
         """
         try:
-            self.page.locator(selector).wait_for(state="hidden", timeout=timeout)
+            self.locator(selector).wait_for(state="hidden", timeout=timeout)
             return True
-        except Exception:
+        except PlaywrightTimeoutError:
             return False
 
     def is_enabled(self, selector: str) -> bool:
@@ -259,7 +397,7 @@ class BasePage:
         Returns:
             True if enabled, False otherwise
         """
-        return self.page.locator(selector).is_enabled()
+        return self.locator(selector).is_enabled()
 
     def is_disabled(self, selector: str) -> bool:
         """
@@ -271,7 +409,7 @@ class BasePage:
         Returns:
             True if disabled, False otherwise
         """
-        return self.page.locator(selector).is_disabled()
+        return self.locator(selector).is_disabled()
 
     def is_checked(self, selector: str) -> bool:
         """
@@ -283,7 +421,7 @@ class BasePage:
         Returns:
             True if checked, False otherwise
         """
-        return self.page.locator(selector).is_checked()
+        return self.locator(selector).is_checked()
 
     def count_elements(self, selector: str) -> int:
         """
@@ -295,7 +433,34 @@ class BasePage:
         Returns:
             Number of matching elements
         """
-        return self.page.locator(selector).count()
+        return self.locator(selector).count()
+
+    def _login_state(self, welcome_selector: str) -> Tuple[bool, Optional[str]]:
+        """
+        Get the cached login state, probing the welcome link once if needed.
+
+        The cache is cleared by navigation and by the login/signup/logout
+        flows of the subclasses.
+
+        Args:
+            welcome_selector: Selector of the "Welcome <user>" nav link
+
+        Returns:
+            Tuple of (logged in, username or None)
+        """
+        if self._login_cache is None:
+            # Returns the bare username (the "Welcome " prefix stripped in page), or null
+            username = self.page.evaluate(
+                """(selector) => {
+                    const el = document.querySelector(selector);
+                    if (!el || getComputedStyle(el).display === "none"
+                        || el.getClientRects().length === 0) return null;
+                    return (el.textContent || "").replace(/^\\s*Welcome\\s*/i, "").trim();
+                }""",
+                welcome_selector,
+            )
+            self._login_cache = (username is not None, username)
+        return self._login_cache
 
     # ========================================
     # Wait Methods
@@ -312,8 +477,8 @@ class BasePage:
             state: Element state (visible, hidden, attached, detached)
             timeout: Optional custom timeout
         """
-        logger.debug(f"Waiting for '{selector}' to be {state}")
-        self.page.wait_for_selector(selector, state=state, timeout=timeout or self.timeout)
+        logger.debug("Waiting for '%s' to be %s", selector, state)
+        self.page.wait_for_selector(selector, state=state, timeout=self._resolve_timeout(timeout))
 
     def wait_for_url(self, url: str, timeout: Optional[int] = None) -> None:
         """
@@ -323,8 +488,8 @@ class BasePage:
             url: URL pattern to wait for
             timeout: Optional custom timeout
         """
-        logger.debug(f"Waiting for URL: {url}")
-        self.page.wait_for_url(url, timeout=timeout or self.timeout)
+        logger.debug("Waiting for URL: %s", url)
+        self.page.wait_for_url(url, timeout=self._resolve_timeout(timeout))
 
     def wait_for_load_state(
         self, state: str = "load", timeout: Optional[int] = None
@@ -336,7 +501,7 @@ class BasePage:
             state: Load state (load, domcontentloaded, networkidle)
             timeout: Optional custom timeout
         """
-        self.page.wait_for_load_state(state, timeout=timeout or self.timeout)
+        self.page.wait_for_load_state(state, timeout=self._resolve_timeout(timeout))
 
     def wait_for_timeout(self, timeout: int) -> None:
         """
@@ -359,7 +524,7 @@ class BasePage:
             selector: Element selector
             timeout: Optional custom timeout
         """
-        expect(self.page.locator(selector)).to_be_visible(timeout=timeout or self.timeout)
+        expect(self.locator(selector)).to_be_visible(timeout=self._resolve_timeout(timeout))
 
     def expect_hidden(self, selector: str, timeout: Optional[int] = None) -> None:
         """
@@ -369,7 +534,7 @@ class BasePage:
             selector: Element selector
             timeout: Optional custom timeout
         """
-        expect(self.page.locator(selector)).to_be_hidden(timeout=timeout or self.timeout)
+        expect(self.locator(selector)).to_be_hidden(timeout=self._resolve_timeout(timeout))
 
     def expect_text(
         self, selector: str, text: str, timeout: Optional[int] = None
@@ -382,8 +547,8 @@ class BasePage:
             text: Expected text
             timeout: Optional custom timeout
         """
-        expect(self.page.locator(selector)).to_contain_text(
-            text, timeout=timeout or self.timeout
+        expect(self.locator(selector)).to_contain_text(
+            text, timeout=self._resolve_timeout(timeout)
         )
 
     def expect_value(
@@ -397,8 +562,8 @@ class BasePage:
             value: Expected value
             timeout: Optional custom timeout
         """
-        expect(self.page.locator(selector)).to_have_value(
-            value, timeout=timeout or self.timeout
+        expect(self.locator(selector)).to_have_value(
+            value, timeout=self._resolve_timeout(timeout)
         )
 
     def expect_url(self, url: str, timeout: Optional[int] = None) -> None:
@@ -409,7 +574,7 @@ class BasePage:
             url: Expected URL pattern
             timeout: Optional custom timeout
         """
-        expect(self.page).to_have_url(url, timeout=timeout or self.timeout)
+        expect(self.page).to_have_url(url, timeout=self._resolve_timeout(timeout))
 
     def expect_title(self, title: str, timeout: Optional[int] = None) -> None:
         """
@@ -419,7 +584,7 @@ class BasePage:
             title: Expected title
             timeout: Optional custom timeout
         """
-        expect(self.page).to_have_title(title, timeout=timeout or self.timeout)
+        expect(self.page).to_have_title(title, timeout=self._resolve_timeout(timeout))
 
     # ========================================
     # Screenshot Methods
@@ -451,7 +616,7 @@ class BasePage:
             Screenshot bytes
         """
         logger.info(f"Taking element screenshot: {selector}")
-        return self.page.locator(selector).screenshot(path=path)
+        return self.locator(selector).screenshot(path=path)
 
     # ========================================
     # JavaScript Methods
@@ -477,7 +642,7 @@ class BasePage:
         Args:
             selector: Element selector
         """
-        self.page.locator(selector).scroll_into_view_if_needed()
+        self.locator(selector).scroll_into_view_if_needed()
 
     def scroll_to_bottom(self) -> None:
         """Scroll to bottom of page."""
@@ -500,22 +665,78 @@ class BasePage:
         """
         return self.page.eval_on_selector_all("a[href]", "elements => elements.map(e => e.href)")
 
-    def accept_alert(self) -> None:
-        """Accept browser alert dialog."""
-        self.page.on("dialog", lambda dialog: dialog.accept())
+    def handle_alert_and_get_text(
+        self, trigger: Callable[[], None], timeout: int = 5000, accept: bool = True
+    ) -> Optional[str]:
+        """
+        Run an action that raises a browser alert, close it and get its text.
 
-    def dismiss_alert(self) -> None:
-        """Dismiss browser alert dialog."""
-        self.page.on("dialog", lambda dialog: dialog.dismiss())
+        The dialog listener only lives for the duration of the call.
 
-    def get_alert_text(self) -> Optional[str]:
-        """Get alert dialog text."""
-        alert_text = None
+        Args:
+            trigger: Action expected to open the alert (e.g. a button click)
+            timeout: Timeout in milliseconds
+            accept: Accept the alert if True, dismiss it otherwise
 
-        def handle_dialog(dialog):
-            nonlocal alert_text
-            alert_text = dialog.message
+        Returns:
+            Alert text if an alert appeared within timeout, None otherwise
+        """
+        try:
+            with self.page.expect_event("dialog", timeout=timeout) as dialog_info:
+                trigger()
+        except PlaywrightTimeoutError:
+            logger.info("No alert appeared")
+            return None
+        dialog = dialog_info.value
+        alert_text = dialog.message
+        logger.info(f"Alert captured: {alert_text}")
+        if accept:
             dialog.accept()
-
-        self.page.on("dialog", handle_dialog)
+        else:
+            dialog.dismiss()
         return alert_text
+
+    def accept_alert(
+        self, trigger: Optional[Callable[[], None]] = None, timeout: int = 5000
+    ) -> None:
+        """
+        Accept a browser alert dialog.
+
+        Args:
+            trigger: Action that opens the alert; if omitted, the next alert
+                the page shows is accepted
+            timeout: Timeout in milliseconds when a trigger is given
+        """
+        if trigger is None:
+            self.page.once("dialog", lambda dialog: dialog.accept())
+        else:
+            self.handle_alert_and_get_text(trigger, timeout)
+
+    def dismiss_alert(
+        self, trigger: Optional[Callable[[], None]] = None, timeout: int = 5000
+    ) -> None:
+        """
+        Dismiss a browser alert dialog.
+
+        Args:
+            trigger: Action that opens the alert; if omitted, the next alert
+                the page shows is dismissed
+            timeout: Timeout in milliseconds when a trigger is given
+        """
+        if trigger is None:
+            self.page.once("dialog", lambda dialog: dialog.dismiss())
+        else:
+            self.handle_alert_and_get_text(trigger, timeout, accept=False)
+
+    def get_alert_text(self, trigger: Callable[[], None], timeout: int = 5000) -> Optional[str]:
+        """
+        Get the text of the alert an action raises, accepting the alert.
+
+        Args:
+            trigger: Action expected to open the alert
+            timeout: Timeout in milliseconds
+
+        Returns:
+            Alert text if an alert appeared within timeout, None otherwise
+        """
+        return self.handle_alert_and_get_text(trigger, timeout)
@@ -5,10 +5,12 @@ Handles cart interactions including viewing items, removing products,
 and proceeding to checkout.
 """
 
-from typing import List, Optional
+import math
+from typing import List, Optional, Tuple
 
 from playwright.sync_api import Page
 
+from config.settings import settings
 from ui_tests.pages.base_page import BasePage
 from utils.logger import get_logger
 
@@ -31,6 +33,7 @@ class CartPage(BasePage):
     # Actions
     PLACE_ORDER_BUTTON = 'button[data-target="#orderModal"]'
     CONTINUE_SHOPPING_LINK = 'a[href="index.html"]'
+    HOME_PRODUCT_CARDS = "#tbodyid .card"
 
     # Order Modal
     ORDER_MODAL = "#orderModal"
@@ -43,6 +46,17 @@ class CartPage(BasePage):
     ORDER_PURCHASE_BUTTON = 'button[onclick="purchaseOrder()"]'
     ORDER_CLOSE_BUTTON = "#orderModal .close"
 
+    # Reads every row's title/price plus the total in a single browser round trip
+    _SNAPSHOT_SCRIPT = """
+        ([rowSelector, titleSelector, priceSelector, totalSelector]) => ({
+            rows: Array.from(document.querySelectorAll(rowSelector), (row) => [
+                row.querySelector(titleSelector)?.innerText ?? "",
+                row.querySelector(priceSelector)?.innerText ?? "",
+            ]),
+            total: document.querySelector(totalSelector)?.innerText ?? "",
+        })
+    """
+
     def __init__(self, page: Page):
         """Initialize Cart page."""
         super().__init__(page)
@@ -71,9 +85,31 @@ class CartPage(BasePage):
             Number of cart items
         """
         count = self.count_elements(self.CART_ITEMS)
-        logger.debug(f"Cart has {count} items")
+        logger.debug("Cart has %d items", count)
         return count
 
+    def _read_cart(self) -> Tuple[List[Tuple[str, str]], str]:
+        """
+        Read all cart rows and the total price text in one evaluate call.
+
+        Returns:
+            Tuple of ([(title, price), ...], total price text)
+        """
+        snapshot = self.page.evaluate(
+            self._SNAPSHOT_SCRIPT,
+            [self.CART_ITEMS, self.CART_ITEM_TITLE, self.CART_ITEM_PRICE, self.TOTAL_PRICE],
+        )
+        return [tuple(row) for row in snapshot["rows"]], snapshot["total"]
+
+    def _snapshot_cart(self) -> List[Tuple[str, str]]:
+        """
+        Get (title, price) pairs for all cart rows.
+
+        Returns:
+            List of (title, price) tuples in table order
+        """
+        return self._read_cart()[0]
+
     def get_cart_item_titles(self) -> List[str]:
         """
         Get titles of all items in cart.
@@ -81,12 +117,8 @@ class CartPage(BasePage):
         Returns:
             List of product titles
         """
-        items = self.page.locator(self.CART_ITEMS).all()
-        titles = []
-        for item in items:
-            title = item.locator(self.CART_ITEM_TITLE).inner_text()
-            titles.append(title)
-        logger.debug(f"Cart items: {titles}")
+        titles = [title for title, _ in self._snapshot_cart()]
+        logger.debug("Cart items: %s", titles)
         return titles
 
     def get_cart_item_prices(self) -> List[str]:
@@ -96,12 +128,8 @@ class CartPage(BasePage):
         Returns:
             List of product prices
         """
-        items = self.page.locator(self.CART_ITEMS).all()
-        prices = []
-        for item in items:
-            price = item.locator(self.CART_ITEM_PRICE).inner_text()
-            prices.append(price)
-        logger.debug(f"Cart prices: {prices}")
+        prices = [price for _, price in self._snapshot_cart()]
+        logger.debug("Cart prices: %s", prices)
         return prices
 
     def is_product_in_cart(self, product_name: str) -> bool:
@@ -114,8 +142,50 @@ class CartPage(BasePage):
         Returns:
             True if product is in cart
         """
-        titles = self.get_cart_item_titles()
-        return product_name in titles
+        return self.page.evaluate(
+            """([rowSelector, titleSelector, name]) =>
+                Array.from(document.querySelectorAll(rowSelector)).some(
+                    (row) => row.querySelector(titleSelector)?.innerText.trim() === name
+                )""",
+            [self.CART_ITEMS, self.CART_ITEM_TITLE, product_name],
+        )
+
+    def seed_cart(self, product_ids: List[int]) -> "CartPage":
+        """
+        Add products to the current session's cart directly through the API.
+
+        DemoBlaze keeps the cart server-side, keyed by the ``user`` cookie
+        it sets on first visit, so the page must already be on the site.
+        All items are posted concurrently from the page in one round trip.
+        Use it to stage cart state for tests that do not exercise the
+        add-to-cart UI.
+
+        Args:
+            product_ids: Product ids to add (duplicates add the product twice)
+
+        Returns:
+            Self for method chaining
+        """
+        logger.info("Seeding cart with products %s", product_ids)
+        self.page.evaluate(
+            """async ({ apiUrl, productIds }) => {
+                const match = document.cookie.match(/(?:^|; )user=([^;]+)/);
+                if (!match) throw new Error("DemoBlaze user cookie not set; open the site first");
+                const responses = await Promise.all(productIds.map((prodId) =>
+                    fetch(`${apiUrl}/addtocart`, {
+                        method: "POST",
+                        headers: { "Content-Type": "application/json" },
+                        body: JSON.stringify({
+                            id: crypto.randomUUID(), cookie: match[1], prod_id: prodId, flag: false,
+                        }),
+                    })
+                ));
+                const failed = responses.filter((r) => !r.ok).map((r) => r.status);
+                if (failed.length) throw new Error(`addtocart failed: ${failed}`);
+            }""",
+            {"apiUrl": settings.api_base_url, "productIds": list(product_ids)},
+        )
+        return self
 
     def remove_item_by_index(self, index: int) -> "CartPage":
         """
@@ -128,11 +198,10 @@ class CartPage(BasePage):
             Self for method chaining
         """
         logger.info(f"Removing cart item at index {index}")
-        items = self.page.locator(self.CART_ITEMS).all()
-        if index < len(items):
-            delete_button = items[index].locator(self.CART_ITEM_DELETE)
-            delete_button.click()
-            self.wait_for_timeout(1000)  # Wait for removal
+        count = self.locator(self.CART_ITEMS).count()
+        if index < count:
+            self.locator(self.CART_ITEMS).nth(index).locator(self.CART_ITEM_DELETE).click()
+            self._wait_for_item_count(count - 1)
         return self
 
     def remove_all_items(self) -> "CartPage":
@@ -143,11 +212,29 @@ class CartPage(BasePage):
             Self for method chaining
         """
         logger.info("Removing all items from cart")
-        while self.get_cart_item_count() > 0:
-            self.remove_item_by_index(0)
-            self.wait_for_timeout(500)
+        initial = self.get_cart_item_count()
+        delete_button = self.locator(self.CART_ITEMS).first.locator(self.CART_ITEM_DELETE)
+        for removed in range(1, initial + 1):
+            delete_button.click()
+            self._wait_for_item_count(initial - removed)
         return self
 
+    def _wait_for_item_count(self, expected: int) -> None:
+        """
+        Wait for the cart table to settle at an exact row count.
+
+        The table is emptied and re-rendered after a delete call, so waiting
+        for "fewer rows" could match the transient empty table.
+
+        Args:
+            expected: Row count to wait for
+        """
+        self.page.wait_for_function(
+            "([selector, expected]) => document.querySelectorAll(selector).length === expected",
+            arg=[self.CART_ITEMS, expected],
+            timeout=self.timeout,
+        )
+
     # ========================================
     # Total Price Methods
     # ========================================
@@ -160,7 +247,7 @@ class CartPage(BasePage):
             Total price string
         """
         total = self.get_text(self.TOTAL_PRICE)
-        logger.debug(f"Total price: {total}")
+        logger.debug("Total price: %s", total)
         return total
 
     def get_total_price_value(self) -> float:
@@ -182,20 +269,33 @@ class CartPage(BasePage):
         """
         prices = self.get_cart_item_prices()
         total = sum(float(price) for price in prices)
-        logger.debug(f"Calculated total: {total}")
+        logger.debug("Calculated total: %s", total)
         return total
 
     def verify_total_matches_items(self) -> bool:
         """
         Verify total price matches sum of item prices.
 
+        Waits for the total to render, then reads rows and total in one round
+        trip and compares them to the cent, so float rounding in the sum
+        cannot cause a false mismatch. A total that never renders counts as 0
+        only if the cart has no rows.
+
         Returns:
             True if total is correct
         """
-        expected = self.calculate_expected_total()
-        actual = self.get_total_price_value()
-        matches = expected == actual
-        logger.debug(f"Total verification: expected={expected}, actual={actual}, matches={matches}")
+        # The total is filled in with the rows from the /view responses after load
+        total_rendered = self.wait_until_visible(self.TOTAL_PRICE, timeout=self.timeout)
+        rows, total_text = self._read_cart()
+        if not total_rendered or not total_text.strip():
+            logger.debug("No total rendered; cart rows: %d", len(rows))
+            return not rows
+        expected = sum(float(price) for _, price in rows)
+        actual = float(total_text)
+        matches = math.isclose(expected, actual, abs_tol=0.01)
+        logger.debug(
+            "Total verification: expected=%s, actual=%s, matches=%s", expected, actual, matches
+        )
         return matches
 
     # ========================================
@@ -227,7 +327,8 @@ class CartPage(BasePage):
         """Navigate back to homepage."""
         logger.info("Continuing shopping")
         self.click(self.CONTINUE_SHOPPING_LINK)
-        self.wait_for_load_state("networkidle")
+        self.wait_for_url("**/index.html")
+        self.wait_for_selector(self.HOME_PRODUCT_CARDS)
 
     # ========================================
     # Order Modal Methods
@@ -240,7 +341,7 @@ class CartPage(BasePage):
         Returns:
             True if modal is visible
         """
-        return self.is_visible(self.ORDER_MODAL, timeout=3000)
+        return self.is_visible(self.ORDER_MODAL)
 
     def fill_order_form(
         self,
@@ -266,12 +367,16 @@ class CartPage(BasePage):
             Self for method chaining
         """
         logger.info(f"Filling order form for {name}")
-        self.fill(self.ORDER_NAME_INPUT, name)
-        self.fill(self.ORDER_COUNTRY_INPUT, country)
-        self.fill(self.ORDER_CITY_INPUT, city)
-        self.fill(self.ORDER_CARD_INPUT, card)
-        self.fill(self.ORDER_MONTH_INPUT, month)
-        self.fill(self.ORDER_YEAR_INPUT, year)
+        self.fill_fields(
+            {
+                self.ORDER_NAME_INPUT: name,
+                self.ORDER_COUNTRY_INPUT: country,
+                self.ORDER_CITY_INPUT: city,
+                self.ORDER_CARD_INPUT: card,
+                self.ORDER_MONTH_INPUT: month,
+                self.ORDER_YEAR_INPUT: year,
+            }
+        )
         return self
 
     def click_purchase(self) -> "CartPage":
@@ -314,7 +419,10 @@ class CartPage(BasePage):
         """
         Check if cart is empty.
 
+        Only checks whether a first row is shown, so it stops at the first
+        match instead of counting every row.
+
         Returns:
             True if cart has no items
         """
-        return self.get_cart_item_count() == 0
+        return not self.locator(self.CART_ITEMS).first.is_visible()
@@ -5,21 +5,61 @@ Handles homepage elements including navigation, product catalog,
 categories, and featured products.
 """
 
-from typing import List, Optional
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from playwright.sync_api import Page
+from playwright.sync_api import Locator, Page, expect
 
 from ui_tests.pages.base_page import BasePage
+from ui_tests.pages.product_detail_page import ProductDetailPage
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_PRODUCT_URL = re.compile(r"/prod\.html")
+
+# Clicks a pagination control up to `steps` times while it stays visible,
+# waiting after each click for the grid to be rebuilt (first card no longer
+# tagged stale), and returns the card count seen after each click.
+_PAGINATE_SCRIPT = """async ([button, cards, steps, timeout]) => {
+    const isVisible = (el) => !!el && el.getClientRects().length > 0
+        && getComputedStyle(el).visibility !== "hidden";
+    const isFresh = () => {
+        const el = document.querySelector(cards);
+        return !!el && !el.dataset.stale;
+    };
+    const counts = [];
+    for (let i = 0; i < steps; i++) {
+        const control = document.querySelector(button);
+        if (!isVisible(control)) break;
+        document.querySelectorAll(cards).forEach((el) => { el.dataset.stale = "1"; });
+        control.click();
+        await new Promise((resolve, reject) => {
+            const observer = new MutationObserver(() => {
+                if (isFresh()) {
+                    clearTimeout(timer);
+                    observer.disconnect();
+                    resolve();
+                }
+            });
+            const timer = setTimeout(() => {
+                observer.disconnect();
+                reject(new Error(`Products did not re-render after ${button} click`));
+            }, timeout);
+            observer.observe(document.body, { childList: true, subtree: true });
+        });
+        counts.push(document.querySelectorAll(cards).length);
+    }
+    return counts;
+}"""
+
 
 class HomePage(BasePage):
     """Home page object model."""
 
     # Page elements
-    LOGO = "#narvbarx"
+    NAV_BRAND = "#nava"
+    NAV_LINKS_VISIBLE = "#navbarExample a:visible"
     NAV_HOME = 'a[href="index.html"]'
     NAV_CONTACT = 'a[data-target="#exampleModal"]'
     NAV_ABOUT_US = 'a[data-target="#videoModal"]'
@@ -29,6 +69,9 @@ class HomePage(BasePage):
     NAV_LOGOUT = "#logout2"
     NAV_USER_NAME = "#nameofuser"
 
+    # Visible nav link labels when logged out, in page order ("(current)" is screen-reader text)
+    NAV_LINK_LABELS = ["Home (current)", "Contact", "About us", "Cart", "Log in", "Sign up"]
+
     # Category filters
     CATEGORIES = "#cat"
     CATEGORY_PHONES = 'a:text("Phones")'
@@ -55,32 +98,60 @@ class HomePage(BasePage):
         """Initialize Home page."""
         super().__init__(page)
         self.page_path = ""
+        self._product_locators: Dict[str, Locator] = {}
+        # Product snapshot for the current grid; only kept once the grid is
+        # known to be fully rendered, and dropped on any grid change
+        self._product_cache: Optional[Dict[str, Any]] = None
+        self._grid_settled = False
+
+    def _reset_page_state(self) -> None:
+        """Drop cached login state and product data from the previous document."""
+        super()._reset_page_state()
+        self._product_cache = None
+        self._grid_settled = False
 
     def open(self) -> "HomePage":
         """
         Navigate to home page.
 
+        Skips the reload when the page is already on the home page, so
+        callers that land there via an earlier step don't pay for a second
+        full load.
+
         Returns:
             Self for method chaining
         """
+        home = self.base_url.rstrip("/")
+        if self.page.url.rstrip("/") in (home, f"{home}/index.html"):
+            logger.info("Already on home page")
+            return self
         self.navigate_to(self.page_path)
         logger.info("Opened home page")
         return self
 
+    def refresh(self) -> None:
+        """Reload the home page and wait for the product grid to render."""
+        super().refresh()
+        self.wait_for_selector(self.PRODUCT_CARDS, state="visible")
+        self._grid_settled = True
+
     # ========================================
     # Navigation Actions
     # ========================================
 
     def click_logo(self) -> "HomePage":
-        """Click site logo."""
-        self.click(self.LOGO)
+        """Click site logo (the brand link) and wait for the home page."""
+        self.click(self.NAV_BRAND)
+        self.wait_for_url("**/index.html")
+        self._reset_page_state()
         return self
 
     def goto_cart(self) -> None:
         """Navigate to shopping cart."""
         logger.info("Navigating to cart")
         self.click(self.NAV_CART)
-        self.wait_for_load_state("networkidle")
+        self.wait_for_url("**/cart.html")
+        self._reset_page_state()
 
     def open_login_modal(self) -> None:
         """Open login modal dialog."""
@@ -106,6 +177,13 @@ class HomePage(BasePage):
         self.click(self.NAV_ABOUT_US)
         self.wait_for_selector("#videoModal .modal-content", state="visible")
 
+    def close_open_modals(self) -> None:
+        """Dismiss any open Bootstrap modal and wait for its backdrop to go."""
+        if self.page.locator(".modal.show").count():
+            logger.info("Closing open modal")
+            self.page.keyboard.press("Escape")
+            self.wait_for_selector(".modal-backdrop", state="hidden")
+
     def logout(self) -> "HomePage":
         """
         Logout user.
@@ -115,6 +193,7 @@ class HomePage(BasePage):
         """
         logger.info("Logging out user")
         self.click(self.NAV_LOGOUT)
+        self._login_cache = None
         self.wait_for_selector(self.NAV_LOGIN, state="visible")
         return self
 
@@ -130,8 +209,7 @@ class HomePage(BasePage):
             Self for method chaining
         """
         logger.info("Filtering by Phones category")
-        self.click(self.CATEGORY_PHONES)
-        self.wait_for_load_state("networkidle")
+        self._click_and_wait_for_products(self.CATEGORY_PHONES)
         return self
 
     def filter_by_laptops(self) -> "HomePage":
@@ -142,8 +220,7 @@ class HomePage(BasePage):
             Self for method chaining
         """
         logger.info("Filtering by Laptops category")
-        self.click(self.CATEGORY_LAPTOPS)
-        self.wait_for_load_state("networkidle")
+        self._click_and_wait_for_products(self.CATEGORY_LAPTOPS)
         return self
 
     def filter_by_monitors(self) -> "HomePage":
@@ -154,10 +231,37 @@ class HomePage(BasePage):
             Self for method chaining
         """
         logger.info("Filtering by Monitors category")
-        self.click(self.CATEGORY_MONITORS)
-        self.wait_for_load_state("networkidle")
+        self._click_and_wait_for_products(self.CATEGORY_MONITORS)
         return self
 
+    def _click_and_wait_for_products(self, selector: str) -> None:
+        """
+        Click a control that re-renders the product grid and wait for the new grid.
+
+        The current cards are tagged before the click. The grid is emptied and
+        rebuilt from the API response, so the first untagged card marks the
+        new content. This works even when the first title stays the same,
+        e.g. Phones after the default listing.
+
+        Args:
+            selector: Selector of the category or pagination control
+        """
+        # Let the initial listing finish rendering so it is not mistaken for the new grid
+        self.wait_for_selector(self.PRODUCT_CARDS, state="attached")
+        self.page.evaluate(
+            "(s) => document.querySelectorAll(s).forEach((el) => { el.dataset.stale = '1'; })",
+            self.PRODUCT_CARDS,
+        )
+        self._product_cache = None
+        self._grid_settled = False
+        self.click(selector)
+        self.page.wait_for_function(
+            "(s) => { const el = document.querySelector(s); return el && !el.dataset.stale; }",
+            arg=self.PRODUCT_CARDS,
+            timeout=self.timeout,
+        )
+        self._grid_settled = True
+
     # ========================================
     # Product Interaction
     # ========================================
@@ -169,8 +273,8 @@ class HomePage(BasePage):
         Returns:
             Number of products
         """
-        count = self.count_elements(self.PRODUCT_CARDS)
-        logger.debug(f"Found {count} products")
+        count = self.get_product_snapshot()["count"]
+        logger.debug("Found %d products", count)
         return count
 
     def get_product_titles(self) -> List[str]:
@@ -180,8 +284,8 @@ class HomePage(BasePage):
         Returns:
             List of product titles
         """
-        titles = self.page.locator(self.PRODUCT_TITLES).all_inner_texts()
-        logger.debug(f"Retrieved {len(titles)} product titles")
+        titles = list(self.get_product_snapshot()["titles"])
+        logger.debug("Retrieved %d product titles", len(titles))
         return titles
 
     def get_product_prices(self) -> List[str]:
@@ -191,10 +295,94 @@ class HomePage(BasePage):
         Returns:
             List of product prices
         """
-        prices = self.page.locator(self.PRODUCT_PRICES).all_inner_texts()
-        logger.debug(f"Retrieved {len(prices)} product prices")
+        prices = list(self.get_product_snapshot()["prices"])
+        logger.debug("Retrieved %d product prices", len(prices))
         return prices
 
+    def get_product_titles_and_prices(self) -> List[Tuple[str, str]]:
+        """
+        Get (title, price) pairs for all products in one evaluate call.
+
+        Returns:
+            List of (title, price) tuples in display order
+        """
+        products = self.page.evaluate(
+            """([cardSelector, titleSelector, priceSelector]) =>
+                Array.from(document.querySelectorAll(cardSelector), (card) => [
+                    card.querySelector(titleSelector)?.innerText ?? "",
+                    card.querySelector(priceSelector)?.innerText ?? "",
+                ])""",
+            [self.PRODUCT_CARDS, self.PRODUCT_TITLES, self.PRODUCT_PRICES],
+        )
+        logger.debug("Retrieved %d products", len(products))
+        return [tuple(product) for product in products]
+
+    def get_product_snapshot(self) -> Dict[str, Any]:
+        """
+        Read product count, titles, prices and link count in one evaluate call.
+
+        Each list is queried independently (not per card), so the lengths can
+        be compared against ``count`` just like the individual getters.
+
+        Once a filter, pagination or refresh has waited for the grid to
+        render, the snapshot is cached until the next grid change or
+        navigation, so repeated reads cost no browser round trip.
+
+        Returns:
+            Dict with ``count``, ``titles``, ``prices`` and ``links`` keys
+        """
+        if self._product_cache is not None:
+            return self._product_cache
+        snapshot = self.page.evaluate(
+            """([cards, titles, prices, links]) => {
+                const texts = (sel) =>
+                    Array.from(document.querySelectorAll(sel), (el) => el.innerText);
+                return {
+                    count: document.querySelectorAll(cards).length,
+                    titles: texts(titles),
+                    prices: texts(prices),
+                    links: document.querySelectorAll(links).length,
+                };
+            }""",
+            [self.PRODUCT_CARDS, self.PRODUCT_TITLES, self.PRODUCT_PRICES, self.PRODUCT_LINKS],
+        )
+        logger.debug("Product snapshot: %d cards", snapshot["count"])
+        if self._grid_settled:
+            self._product_cache = snapshot
+        return snapshot
+
+    def _product_link(self, product_name: str) -> Locator:
+        """
+        Get the memoised link Locator for a product name.
+
+        Args:
+            product_name: Product name
+
+        Returns:
+            Locator for the first product link containing the name
+        """
+        loc = self._product_locators.get(product_name)
+        if loc is None:
+            loc = self.locator(self.PRODUCT_LINKS).filter(has_text=product_name).first
+            self._product_locators[product_name] = loc
+        return loc
+
+    def prime_product_locators(self, names: Iterable[str]) -> "HomePage":
+        """
+        Pre-build link Locators for a known product catalog.
+
+        Locators are lazy, so primed entries stay valid across navigations.
+
+        Args:
+            names: Product names that will be looked up
+
+        Returns:
+            Self for method chaining
+        """
+        for name in names:
+            self._product_link(name)
+        return self
+
     def click_product_by_name(self, product_name: str) -> None:
         """
         Click on product by name.
@@ -203,8 +391,8 @@ class HomePage(BasePage):
             product_name: Name of the product to click
         """
         logger.info(f"Clicking on product: {product_name}")
-        self.click(f'a:text("{product_name}")')
-        self.wait_for_load_state("networkidle")
+        self._product_link(product_name).click()
+        self._wait_for_product_page()
 
     def click_product_by_index(self, index: int) -> None:
         """
@@ -214,13 +402,53 @@ class HomePage(BasePage):
             index: Product index to click
         """
         logger.info(f"Clicking on product at index: {index}")
-        products = self.page.locator(self.PRODUCT_LINKS).all()
-        if index < len(products):
-            products[index].click()
-            self.wait_for_load_state("networkidle")
+        links = self.locator(self.PRODUCT_LINKS)
+        if self._product_cache is not None:
+            # Settled grid already read; bounds-check without touching the DOM
+            link_count = self._product_cache["links"]
+        else:
+            # The grid is rendered from an API call after DOMContentLoaded
+            links.first.wait_for(state="attached", timeout=self.timeout)
+            link_count = links.count()
+        if 0 <= index < link_count:
+            links.nth(index).click()
+            self._wait_for_product_page()
         else:
             raise IndexError(f"Product index {index} out of range")
 
+    def _wait_for_product_page(self) -> None:
+        """Wait for a product page opened from the grid to show its details."""
+        self.page.wait_for_url(_PRODUCT_URL, wait_until="domcontentloaded")
+        self._reset_page_state()
+        # Name and price are filled in from the /view API after DOMContentLoaded
+        self.wait_for_selector(ProductDetailPage.PRODUCT_NAME, state="visible")
+
+    def get_product_path(self, index: int) -> str:
+        """
+        Get the product page link of a product by index (0-based).
+
+        Args:
+            index: Product index
+
+        Returns:
+            Product URL relative to the base URL, e.g. ``prod.html?idp_=1``
+        """
+        links = self.locator(self.PRODUCT_LINKS)
+        links.first.wait_for(state="attached", timeout=self.timeout)
+        return links.nth(index).get_attribute("href")
+
+    def add_product_by_index_to_cart(self, index: int) -> None:
+        """
+        Open product by index (0-based) and add it to the cart.
+
+        Leaves the browser on the product detail page.
+
+        Args:
+            index: Product index to add
+        """
+        self.click_product_by_index(index)
+        ProductDetailPage(self.page).add_to_cart_and_accept_alert()
+
     def is_product_visible(self, product_name: str) -> bool:
         """
         Check if product with given name is visible.
@@ -231,7 +459,13 @@ class HomePage(BasePage):
         Returns:
             True if product is visible
         """
-        return self.is_visible(f'a:text("{product_name}")', timeout=3000)
+        return self.page.evaluate(
+            """([titleSelector, name]) =>
+                Array.from(document.querySelectorAll(titleSelector)).some(
+                    (el) => el.innerText.trim() === name && el.getClientRects().length > 0
+                )""",
+            [self.PRODUCT_TITLES, product_name],
+        )
 
     # ========================================
     # Pagination
@@ -245,8 +479,7 @@ class HomePage(BasePage):
             Self for method chaining
         """
         logger.info("Navigating to next page")
-        self.click(self.NEXT_BUTTON)
-        self.wait_for_load_state("networkidle")
+        self._click_and_wait_for_products(self.NEXT_BUTTON)
         return self
 
     def click_previous_page(self) -> "HomePage":
@@ -257,10 +490,34 @@ class HomePage(BasePage):
             Self for method chaining
         """
         logger.info("Navigating to previous page")
-        self.click(self.PREV_BUTTON)
-        self.wait_for_load_state("networkidle")
+        self._click_and_wait_for_products(self.PREV_BUTTON)
         return self
 
+    def paginate_and_collect(self, steps: int, backwards: bool = False) -> List[int]:
+        """
+        Page through the catalogue in one browser call.
+
+        Stops early if the pagination control is no longer visible.
+
+        Args:
+            steps: Maximum number of pagination clicks
+            backwards: Click Previous instead of Next
+
+        Returns:
+            Product count after each click
+        """
+        button = self.PREV_BUTTON if backwards else self.NEXT_BUTTON
+        logger.info(f"Paginating {steps} step(s) via {button}")
+        self.wait_for_selector(self.PRODUCT_CARDS, state="attached")
+        self._product_cache = None
+        self._grid_settled = False
+        counts = self.page.evaluate(
+            _PAGINATE_SCRIPT, [button, self.PRODUCT_CARDS, steps, self.timeout]
+        )
+        # Only a completed click-and-wait proves the grid has rendered
+        self._grid_settled = bool(counts)
+        return counts
+
     def is_next_button_enabled(self) -> bool:
         """Check if next button is enabled."""
         return self.is_visible(self.NEXT_BUTTON)
@@ -280,7 +537,7 @@ class HomePage(BasePage):
         Returns:
             True if user is logged in
         """
-        return self.is_visible(self.NAV_USER_NAME, timeout=3000)
+        return self._login_state(self.NAV_USER_NAME)[0]
 
     def get_logged_in_username(self) -> Optional[str]:
         """
@@ -289,23 +546,30 @@ class HomePage(BasePage):
         Returns:
             Username if logged in, None otherwise
         """
-        if self.is_logged_in():
-            text = self.get_text(self.NAV_USER_NAME)
-            # Extract username from "Welcome username"
-            return text.replace("Welcome", "").strip()
-        return None
+        return self._login_state(self.NAV_USER_NAME)[1]
 
     def is_login_button_visible(self) -> bool:
         """Check if login button is visible."""
-        return self.is_visible(self.NAV_LOGIN, timeout=3000)
+        return self.is_visible(self.NAV_LOGIN)
 
     def is_signup_button_visible(self) -> bool:
         """Check if signup button is visible."""
-        return self.is_visible(self.NAV_SIGNUP, timeout=3000)
+        return self.is_visible(self.NAV_SIGNUP)
 
     def is_logout_button_visible(self) -> bool:
         """Check if logout button is visible."""
-        return self.is_visible(self.NAV_LOGOUT, timeout=3000)
+        return self.is_visible(self.NAV_LOGOUT)
+
+    def assert_nav_bar_loaded(self) -> None:
+        """
+        Assert the logged-out navigation bar is rendered.
+
+        Uses Playwright's auto-retrying assertions, so the whole bar is
+        checked by one assertion on the visible link labels, in order, instead
+        of a visibility call per link.
+        """
+        expect(self.locator(self.NAV_LINKS_VISIBLE)).to_have_text(self.NAV_LINK_LABELS)
+        expect(self.locator(self.NAV_BRAND)).to_be_visible()
 
     def verify_on_homepage(self) -> bool:
         """
@@ -314,7 +578,12 @@ class HomePage(BasePage):
         Returns:
             True if on homepage
         """
-        return (
-            self.base_url in self.get_current_url()
-            and self.is_visible(self.PRODUCTS_CONTAINER)
+        return self.page.evaluate(
+            """([baseUrl, selector]) => {
+                if (!location.href.includes(baseUrl)) return false;
+                const el = document.querySelector(selector);
+                return !!el && el.getClientRects().length > 0
+                    && getComputedStyle(el).visibility !== "hidden";
+            }""",
+            [self.base_url, self.PRODUCTS_CONTAINER],
         )
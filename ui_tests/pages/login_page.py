@@ -4,15 +4,19 @@ Login Page object for DemoBlaze authentication.
 Handles login modal, signup modal, and authentication flows.
 """
 
-from typing import Optional
+import time
+from typing import Callable, Dict, List, Optional
 
-from playwright.sync_api import Page
+from playwright.sync_api import Dialog, Page
 
 from ui_tests.pages.base_page import BasePage
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Slice (ms) between checks for a rejection alert while waiting for a login to complete
+_AUTH_POLL_INTERVAL = 250
+
 
 class LoginPage(BasePage):
     """Login page object model for authentication."""
@@ -39,6 +43,9 @@ class LoginPage(BasePage):
     NAV_LOGOUT_LINK = "#logout2"
     NAV_WELCOME_USER = "#nameofuser"
 
+    # Lowercased fragment of the alert shown after a successful signup
+    SIGNUP_SUCCESS_TEXT = "sign up successful"
+
     def __init__(self, page: Page):
         """Initialize Login page."""
         super().__init__(page)
@@ -122,11 +129,77 @@ class LoginPage(BasePage):
             Self for method chaining
         """
         logger.info(f"Logging in as: {username}")
+        self._login_cache = None
         self.open_login_modal()
-        self.fill_login_username(username)
-        self.fill_login_password(password)
-        self.click_login_button()
-        self.wait_for_timeout(2000)  # Wait for login processing
+        self.fill_fields(
+            {self.LOGIN_USERNAME_INPUT: username, self.LOGIN_PASSWORD_INPUT: password}
+        )
+        rejection = self._submit_login()
+        if rejection is not None:
+            logger.info(f"Login rejected: {rejection}")
+        return self
+
+    def _submit_login(self) -> Optional[str]:
+        """
+        Click the login button and wait for the site's answer.
+
+        A successful login reloads the page and shows the welcome link; a
+        rejected one raises an alert instead. Waits up to the page timeout
+        for whichever comes first and accepts the alert.
+
+        Returns:
+            Alert text if the login was rejected, None otherwise
+        """
+        alerts: List[str] = []
+
+        def record_alert(dialog: Dialog) -> None:
+            alerts.append(dialog.message)
+            dialog.accept()
+
+        self.page.on("dialog", record_alert)
+        try:
+            self.click_login_button()
+            deadline = time.monotonic() + self.timeout / 1000
+            while not alerts and time.monotonic() < deadline:
+                if self.wait_until_visible(self.NAV_WELCOME_USER, timeout=_AUTH_POLL_INTERVAL):
+                    return None
+        finally:
+            self.page.remove_listener("dialog", record_alert)
+        if not alerts:
+            logger.warning(f"Login did not complete within {self.timeout}ms")
+            return None
+        return alerts[0]
+
+    def fast_login(self, username: str, password: str) -> "LoginPage":
+        """
+        Log in by calling the site's ``logIn()`` directly, skipping the modal UI.
+
+        Intended for tests that need an authenticated session but do not
+        exercise the login form; use login() to test the UI itself.
+
+        Args:
+            username: Username for login
+            password: Password for login
+
+        Returns:
+            Self for method chaining
+        """
+        logger.info(f"Fast login as: {username}")
+        self._login_cache = None
+        self.page.evaluate(
+            """({ userSelector, passwordSelector, username, password }) => {
+                document.querySelector(userSelector).value = username;
+                document.querySelector(passwordSelector).value = password;
+                logIn();
+            }""",
+            {
+                "userSelector": self.LOGIN_USERNAME_INPUT,
+                "passwordSelector": self.LOGIN_PASSWORD_INPUT,
+                "username": username,
+                "password": password,
+            },
+        )
+        self.wait_until_visible(self.NAV_WELCOME_USER)
         return self
 
     # ========================================
@@ -208,11 +281,17 @@ class LoginPage(BasePage):
             Self for method chaining
         """
         logger.info(f"Signing up user: {username}")
+        self._login_cache = None
         self.open_signup_modal()
-        self.fill_signup_username(username)
-        self.fill_signup_password(password)
-        self.click_signup_button()
-        self.wait_for_timeout(2000)  # Wait for signup processing
+        self.fill_fields(
+            {self.SIGNUP_USERNAME_INPUT: username, self.SIGNUP_PASSWORD_INPUT: password}
+        )
+        # The site answers every signup with an alert; only a successful one closes the modal
+        alert_text = self.handle_alert_and_get_text(self.click_signup_button, self.timeout)
+        if alert_text and self.SIGNUP_SUCCESS_TEXT in alert_text.lower():
+            self.wait_until_hidden(self.SIGNUP_MODAL, timeout=self.timeout)
+        else:
+            logger.info(f"Signup rejected: {alert_text}")
         return self
 
     # ========================================
@@ -229,6 +308,7 @@ class LoginPage(BasePage):
         logger.info("Logging out user")
         if self.is_logged_in():
             self.click(self.NAV_LOGOUT_LINK)
+            self._login_cache = None
             self.wait_for_selector(self.NAV_LOGIN_LINK, state="visible")
         return self
 
@@ -243,7 +323,7 @@ class LoginPage(BasePage):
         Returns:
             True if login modal is visible
         """
-        return self.is_visible(self.LOGIN_MODAL, timeout=3000)
+        return self.is_visible(self.LOGIN_MODAL)
 
     def is_signup_modal_open(self) -> bool:
         """
@@ -252,7 +332,26 @@ class LoginPage(BasePage):
         Returns:
             True if signup modal is visible
         """
-        return self.is_visible(self.SIGNUP_MODAL, timeout=3000)
+        return self.is_visible(self.SIGNUP_MODAL)
+
+    def get_auth_state(self) -> Dict[str, bool]:
+        """
+        Get the visibility of all login-related UI in one round trip.
+
+        Returns:
+            Dict with keys login_modal_open, signup_modal_open, logged_in,
+            login_link_visible, signup_link_visible and logout_link_visible
+        """
+        return self.get_visibility(
+            {
+                "login_modal_open": self.LOGIN_MODAL,
+                "signup_modal_open": self.SIGNUP_MODAL,
+                "logged_in": self.NAV_WELCOME_USER,
+                "login_link_visible": self.NAV_LOGIN_LINK,
+                "signup_link_visible": self.NAV_SIGNUP_LINK,
+                "logout_link_visible": self.NAV_LOGOUT_LINK,
+            }
+        )
 
     def is_logged_in(self) -> bool:
         """
@@ -261,7 +360,7 @@ class LoginPage(BasePage):
         Returns:
             True if user is logged in
         """
-        return self.is_visible(self.NAV_WELCOME_USER, timeout=3000)
+        return self._login_state(self.NAV_WELCOME_USER)[0]
 
     def get_logged_in_username(self) -> Optional[str]:
         """
@@ -270,11 +369,7 @@ class LoginPage(BasePage):
         Returns:
             Username if logged in, None otherwise
         """
-        if self.is_logged_in():
-            text = self.get_text(self.NAV_WELCOME_USER)
-            # Extract username from "Welcome username"
-            return text.replace("Welcome", "").strip()
-        return None
+        return self._login_state(self.NAV_WELCOME_USER)[1]
 
     def is_login_button_enabled(self) -> bool:
         """
@@ -316,45 +411,21 @@ class LoginPage(BasePage):
     # Alert Handling
     # ========================================
 
-    def handle_alert_and_get_text(self) -> Optional[str]:
+    def expect_alert_with_text(
+        self, trigger: Callable[[], None], expected_text: str, timeout: int = 5000
+    ) -> bool:
         """
-        Handle browser alert and get text.
+        Run an action and verify it raises an alert with specific text.
 
-        Returns:
-            Alert text if present
-        """
-        alert_text = None
-
-        def handle_dialog(dialog):
-            nonlocal alert_text
-            alert_text = dialog.message
-            logger.info(f"Alert captured: {alert_text}")
-            dialog.accept()
-
-        self.page.on("dialog", handle_dialog)
-        return alert_text
-
-    def expect_alert_with_text(self, expected_text: str, timeout: int = 5000) -> bool:
-        """
-        Wait for and verify alert with specific text.
+        Returns as soon as the alert appears instead of waiting out the timeout.
 
         Args:
-            expected_text: Expected alert text
+            trigger: Action expected to open the alert
+            expected_text: Expected alert text (case-insensitive substring)
             timeout: Timeout in milliseconds
 
         Returns:
             True if alert appears with expected text
         """
-        alert_appeared = False
-        alert_text = None
-
-        def handle_dialog(dialog):
-            nonlocal alert_appeared, alert_text
-            alert_text = dialog.message
-            alert_appeared = expected_text.lower() in alert_text.lower()
-            logger.info(f"Alert appeared: {alert_text}")
-            dialog.accept()
-
-        self.page.on("dialog", handle_dialog)
-        self.wait_for_timeout(timeout)
-        return alert_appeared
+        alert_text = self.handle_alert_and_get_text(trigger, timeout)
+        return alert_text is not None and expected_text.lower() in alert_text.lower()
@@ -5,15 +5,18 @@ Handles product detail page interactions including product information,
 add to cart, and image gallery.
 """
 
-from typing import Optional
+import re
+from typing import Optional, Tuple
 
-from playwright.sync_api import Page
+from playwright.sync_api import Locator, Page
 
 from ui_tests.pages.base_page import BasePage
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_PRICE_RE = re.compile(r"[-+]?\d+(?:\.\d+)?")
+
 
 class ProductDetailPage(BasePage):
     """Product detail page object model."""
@@ -34,21 +37,58 @@ class ProductDetailPage(BasePage):
     def __init__(self, page: Page):
         """Initialize Product Detail page."""
         super().__init__(page)
+        # (page URL, price text) of the last price read
+        self._price_cache: Optional[Tuple[str, str]] = None
 
     # ========================================
     # Navigation Methods
     # ========================================
 
+    def open(self, product_path: str) -> "ProductDetailPage":
+        """
+        Navigate straight to a product page and wait for its details.
+
+        Args:
+            product_path: Product URL relative to the base URL,
+                e.g. ``prod.html?idp_=1``
+
+        Returns:
+            Self for method chaining
+        """
+        self._price_cache = None
+        self.navigate_to(product_path)
+        self.locator(self.PRODUCT_NAME).wait_for(state="visible", timeout=self.timeout)
+        logger.info(f"Opened product page: {product_path}")
+        return self
+
     def go_to_home(self) -> None:
         """Navigate back to homepage."""
         logger.info("Navigating to homepage")
+        self._price_cache = None
         self.click(self.HOME_LINK)
-        self.wait_for_load_state("networkidle")
+        # Product cards load later; callers such as click_product_by_index wait for them
+        self.page.wait_for_url("**/index.html", wait_until="domcontentloaded")
 
     # ========================================
     # Product Information Methods
     # ========================================
 
+    def _visible_text(self, locator: Locator) -> str:
+        """
+        Wait for a cached Locator to become visible and return its text.
+
+        Product details are filled in by an API call after page load, so the
+        elements only become visible once they have content.
+
+        Args:
+            locator: Cached Locator for the element
+
+        Returns:
+            Element text content
+        """
+        locator.wait_for(state="visible", timeout=self.timeout)
+        return locator.inner_text()
+
     def get_product_name(self) -> str:
         """
         Get product name.
@@ -56,19 +96,26 @@ class ProductDetailPage(BasePage):
         Returns:
             Product name
         """
-        name = self.get_text(self.PRODUCT_NAME)
-        logger.debug(f"Product name: {name}")
+        name = self._visible_text(self.locator(self.PRODUCT_NAME))
+        logger.debug("Product name: %s", name)
         return name
 
     def get_product_price(self) -> str:
         """
         Get product price.
 
+        The text is cached per page URL, so format and value checks on the
+        same product share one read. Navigating through any other page
+        object changes the URL and so misses the cache.
+
         Returns:
             Product price string
         """
-        price = self.get_text(self.PRODUCT_PRICE)
-        logger.debug(f"Product price: {price}")
+        url = self.page.url
+        if self._price_cache is None or self._price_cache[0] != url:
+            self._price_cache = (url, self._visible_text(self.locator(self.PRODUCT_PRICE)))
+        price = self._price_cache[1]
+        logger.debug("Product price: %s", price)
         return price
 
     def get_product_price_value(self) -> float:
@@ -76,12 +123,11 @@ class ProductDetailPage(BasePage):
         Get product price as float value.
 
         Returns:
-            Product price as float
+            Product price as float, or 0.0 if the text holds no number
         """
-        price_text = self.get_product_price()
-        # Extract numeric value from price string like "$790 *includes tax"
-        price_str = price_text.split()[0].replace("$", "").strip()
-        return float(price_str)
+        # First number in a price string like "$790 *includes tax"
+        match = _PRICE_RE.search(self.get_product_price())
+        return float(match.group()) if match else 0.0
 
     def get_product_description(self) -> str:
         """
@@ -90,8 +136,8 @@ class ProductDetailPage(BasePage):
         Returns:
             Product description text
         """
-        desc = self.get_text(self.PRODUCT_DESCRIPTION)
-        logger.debug(f"Product description: {desc[:50]}...")
+        desc = self._visible_text(self.locator(self.PRODUCT_DESCRIPTION))
+        logger.debug("Product description: %.50s...", desc)
         return desc
 
     def is_product_image_visible(self) -> bool:
@@ -101,7 +147,7 @@ class ProductDetailPage(BasePage):
         Returns:
             True if image is visible
         """
-        return self.is_visible(self.PRODUCT_IMAGE)
+        return self.locator(self.PRODUCT_IMAGE).is_visible()
 
     def get_product_image_src(self) -> Optional[str]:
         """
@@ -134,7 +180,7 @@ class ProductDetailPage(BasePage):
         Returns:
             True if button is visible
         """
-        return self.is_visible(self.ADD_TO_CART_BUTTON)
+        return self.locator(self.ADD_TO_CART_BUTTON).is_visible()
 
     def add_to_cart_and_accept_alert(self) -> "ProductDetailPage":
         """
@@ -144,15 +190,7 @@ class ProductDetailPage(BasePage):
             Self for method chaining
         """
         logger.info("Adding product to cart")
-
-        # Set up alert handler
-        def handle_alert(dialog):
-            logger.info(f"Alert: {dialog.message}")
-            dialog.accept()
-
-        self.page.on("dialog", handle_alert)
-        self.click_add_to_cart()
-        self.wait_for_timeout(1500)  # Wait for alert
+        self.handle_alert_and_get_text(self.click_add_to_cart)
         return self
 
     def add_to_cart_and_get_alert_text(self) -> Optional[str]:
@@ -163,35 +201,31 @@ class ProductDetailPage(BasePage):
             Alert message text
         """
         logger.info("Adding product to cart and capturing alert")
-        alert_text = None
-
-        def handle_alert(dialog):
-            nonlocal alert_text
-            alert_text = dialog.message
-            logger.info(f"Alert captured: {alert_text}")
-            dialog.accept()
-
-        self.page.on("dialog", handle_alert)
-        self.click_add_to_cart()
-        self.wait_for_timeout(1500)
-        return alert_text
+        return self.handle_alert_and_get_text(self.click_add_to_cart)
 
     # ========================================
     # Verification Methods
     # ========================================
 
-    def is_on_product_detail_page(self) -> bool:
+    def is_on_product_detail_page(self, quick: bool = False) -> bool:
         """
         Verify we're on product detail page.
 
+        Args:
+            quick: Only check the URL, skipping the browser round-trip for
+                element visibility
+
         Returns:
             True if on product detail page
         """
-        return (
-            "prod.html" in self.get_current_url()
-            and self.is_visible(self.PRODUCT_NAME)
-            and self.is_visible(self.ADD_TO_CART_BUTTON)
+        if "prod.html" not in self.get_current_url():
+            return False
+        if quick:
+            return True
+        visibility = self.get_visibility(
+            {"name": self.PRODUCT_NAME, "add_to_cart": self.ADD_TO_CART_BUTTON}
         )
+        return all(visibility.values())
 
     def has_product_information(self) -> bool:
         """
@@ -200,11 +234,14 @@ class ProductDetailPage(BasePage):
         Returns:
             True if name, price, and description are visible
         """
-        return (
-            self.is_visible(self.PRODUCT_NAME)
-            and self.is_visible(self.PRODUCT_PRICE)
-            and self.is_visible(self.PRODUCT_DESCRIPTION)
+        visibility = self.get_visibility(
+            {
+                "name": self.PRODUCT_NAME,
+                "price": self.PRODUCT_PRICE,
+                "description": self.PRODUCT_DESCRIPTION,
+            }
         )
+        return all(visibility.values())
 
     def verify_product_price_format(self) -> bool:
         """
@@ -223,8 +260,4 @@ class ProductDetailPage(BasePage):
         Returns:
             True if price is positive
         """
-        try:
-            price_value = self.get_product_price_value()
-            return price_value > 0
-        except (ValueError, AttributeError):
-            return False
+        return self.get_product_price_value() > 0
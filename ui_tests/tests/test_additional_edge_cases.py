@@ -9,6 +9,15 @@ import pytest
 from playwright.sync_api import Page, expect
 
 from config.settings import settings
+from ui_tests.pages.home_page import HomePage
+
+
+def _add_to_cart_and_accept(page: Page) -> None:
+    """Click add to cart and accept the confirmation alert once it appears."""
+    # The listener is registered before the click, so the alert cannot be missed
+    with page.expect_event("dialog") as dialog_info:
+        page.click("a:has-text('Add to cart')")
+    dialog_info.value.accept()
 
 
 class TestNavigationEdgeCases:
@@ -156,9 +165,7 @@ class TestProductEdgeCases:
 
         # Add to cart multiple times
         for _ in range(3):
-            page.click("a:has-text('Add to cart')")
-            page.wait_for_timeout(300)
-            page.once("dialog", lambda dialog: dialog.accept())
+            _add_to_cart_and_accept(page)
 
         # Check cart
         page.click("#cartur")
@@ -170,28 +177,35 @@ class TestProductEdgeCases:
     def test_product_image_load_failure(self, page: Page):
         """Test handling of broken product images."""
         page.goto(settings.base_url)
+        page.wait_for_selector(".card-img-top")
 
-        # Check for broken images
-        images = page.locator(".card-img-top").all()
-        
-        for img in images[:5]:
-            # Should have valid src or placeholder
-            src = img.get_attribute("src")
-            assert src is not None
+        # Check for broken images: read the first five src attributes in one call
+        srcs = page.eval_on_selector_all(
+            ".card-img-top", "imgs => imgs.slice(0, 5).map(img => img.getAttribute('src'))"
+        )
+
+        # Should have valid src or placeholder
+        assert all(src is not None for src in srcs)
 
     @pytest.mark.ui
     def test_pagination_boundary(self, page: Page):
         """Test pagination at boundaries."""
         page.goto(settings.base_url)
-        page.wait_for_load_state("networkidle")
+        first_card = page.locator(".card").first
+        first_card.wait_for()
 
-        # Try clicking next multiple times
+        # Click next until the button goes away or the listing stops changing
         next_button = page.locator("#next2")
-        
+
         for _ in range(5):
-            if next_button.is_enabled():
-                next_button.click()
-                page.wait_for_timeout(500)
+            if not (next_button.is_visible() and next_button.is_enabled()):
+                break
+            previous = first_card.inner_text()
+            next_button.click()
+            try:
+                expect(first_card).not_to_have_text(previous, timeout=2000)
+            except AssertionError:
+                break  # Already on the last page
 
         # Should handle reaching end gracefully
 
@@ -205,7 +219,7 @@ class TestProductEdgeCases:
             page.click(f".card-title a >> nth={i}")
             page.wait_for_selector("#tbodyid")
             page.go_back()
-            page.wait_for_timeout(200)
+            page.wait_for_selector(".card")
 
         # Should remain functional
 
@@ -219,23 +233,17 @@ class TestCartEdgeCases:
         page.goto(settings.base_url)
 
         # Add items quickly
-        page.click(".card-title a >> nth=0")
-        page.wait_for_selector("#tbodyid")
-        page.click("a:has-text('Add to cart')")
-        page.wait_for_timeout(300)
+        HomePage(page).add_product_by_index_to_cart(0)
 
         page.goto(settings.base_url)
-        page.click(".card-title a >> nth=1")
-        page.wait_for_selector("#tbodyid")
-        page.click("a:has-text('Add to cart')")
-
-        page.wait_for_timeout(500)
+        HomePage(page).add_product_by_index_to_cart(1)
 
         # Go to cart
         page.click("#cartur")
         page.wait_for_selector("#tbodyid")
 
         # Should show both items
+        expect(page.locator("#tbodyid tr")).to_have_count(2)
 
     @pytest.mark.ui
     def test_delete_cart_item_confirmation(self, page: Page):
@@ -243,10 +251,7 @@ class TestCartEdgeCases:
         page.goto(settings.base_url)
 
         # Add item
-        page.click(".card-title a >> nth=0")
-        page.wait_for_selector("#tbodyid")
-        page.click("a:has-text('Add to cart')")
-        page.wait_for_timeout(500)
+        HomePage(page).add_product_by_index_to_cart(0)
 
         # Go to cart and delete
         page.click("#cartur")
@@ -256,7 +261,7 @@ class TestCartEdgeCases:
         delete_links = page.locator("a:has-text('Delete')")
         if delete_links.count() > 0:
             delete_links.first.click()
-            page.wait_for_timeout(500)
+            expect(page.locator("#tbodyid tr")).to_have_count(0)
 
     @pytest.mark.ui
     def test_cart_total_calculation_precision(self, page: Page):
@@ -264,10 +269,7 @@ class TestCartEdgeCases:
         page.goto(settings.base_url)
 
         # Add items and check total
-        page.click(".card-title a >> nth=0")
-        page.wait_for_selector("#tbodyid")
-        page.click("a:has-text('Add to cart')")
-        page.wait_for_timeout(500)
+        HomePage(page).add_product_by_index_to_cart(0)
 
         page.click("#cartur")
         page.wait_for_selector("#tbodyid")
@@ -291,8 +293,7 @@ class TestModalEdgeCases:
         page.click("#login2")
         page.wait_for_selector("#logInModal", state="visible")
         page.keyboard.press("Escape")
-
-        page.wait_for_timeout(300)
+        page.wait_for_selector("#logInModal", state="hidden")
 
         page.click("#signin2")
         page.wait_for_selector("#signInModal", state="visible")
@@ -347,19 +348,13 @@ class TestResponsivenessEdgeCases:
         assert page.locator("body").is_visible()
 
     @pytest.mark.ui
-    def test_extreme_viewport_sizes(self, page: Page):
+    @pytest.mark.parametrize(
+        "width,height", [(280, 640), (3840, 2160)], ids=["very_narrow", "very_wide"]
+    )
+    def test_extreme_viewport_sizes(self, page: Page, width: int, height: int):
         """Test extreme viewport dimensions."""
-        # Very narrow
-        page.set_viewport_size({"width": 280, "height": 640})
-        page.goto(settings.base_url)
-        page.wait_for_load_state("networkidle")
-
-        assert page.locator("body").is_visible()
-
-        # Very wide
-        page.set_viewport_size({"width": 3840, "height": 2160})
-        page.goto(settings.base_url)
-        page.wait_for_load_state("networkidle")
+        page.set_viewport_size({"width": width, "height": height})
+        page.goto(settings.base_url, wait_until="domcontentloaded")
 
         assert page.locator("body").is_visible()
 
@@ -382,10 +377,6 @@ class TestSessionEdgeCases:
         """Test session timeout behavior."""
         page.goto(settings.base_url)
 
-        # Wait for extended period
-        # (Shortened for testing)
-        page.wait_for_timeout(2000)
-
         # Page should still be functional
         page.click("#cartur")
         page.wait_for_selector("#tbodyid")
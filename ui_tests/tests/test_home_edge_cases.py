@@ -24,19 +24,24 @@ class TestHomePageEdgeCases:
         with pytest.raises(IndexError):
             home.click_product_by_index(999)
 
+    @pytest.mark.usefixtures("mock_category_api")
     @pytest.mark.ui
     @pytest.mark.products
-    def test_filter_products_multiple_times(self, page: Page):
-        """Test repeatedly filtering products."""
+    @pytest.mark.parametrize(
+        "filter_method",
+        [HomePage.filter_by_phones, HomePage.filter_by_laptops],
+        ids=["phones", "laptops"],
+    )
+    def test_filter_products_multiple_times(self, page: Page, filter_method):
+        """Test re-applying the same filter keeps products listed."""
         home = HomePage(page).open()
         
-        # Filter multiple times in succession
-        for _ in range(5):
-            home.filter_by_phones()
-            assert home.get_product_count() > 0
-            
-            home.filter_by_laptops()
-            assert home.get_product_count() > 0
+        # Apply the same filter twice in succession
+        filter_method(home)
+        assert home.get_product_count() > 0
+        
+        filter_method(home)
+        assert home.get_product_count() > 0
 
     @pytest.mark.ui
     @pytest.mark.products
@@ -58,28 +63,25 @@ class TestHomePageEdgeCases:
         home.refresh()
         
         # After reload, products should still be visible
-        assert home.get_product_count() >= 0
+        assert home.get_product_count() > 0
 
     @pytest.mark.ui
     @pytest.mark.products
     def test_empty_product_titles_not_allowed(self, page: Page):
         """Test that product titles are never empty strings."""
         home = HomePage(page).open()
-        titles = home.get_product_titles()
+        titles = home.get_product_snapshot()["titles"]
         
-        for title in titles:
-            assert title.strip() != "", "Product title should not be empty"
-            assert len(title) > 0
+        assert all(title.strip() for title in titles), f"Empty product title in {titles}"
 
     @pytest.mark.ui
     @pytest.mark.products
     def test_product_prices_are_always_formatted(self, page: Page):
         """Test all product prices include currency symbol."""
         home = HomePage(page).open()
-        prices = home.get_product_prices()
+        prices = home.get_product_snapshot()["prices"]
         
-        for price in prices:
-            assert "$" in price, f"Price should include $ symbol: {price}"
+        assert all("$" in price for price in prices), f"Price without $ symbol in {prices}"
 
     @pytest.mark.ui
     def test_navigation_links_are_clickable(self, page: Page):
@@ -87,10 +89,7 @@ class TestHomePageEdgeCases:
         home = HomePage(page).open()
         
         # Check that navigation elements are present and enabled
-        assert home.is_visible(home.NAV_HOME)
-        assert home.is_visible(home.NAV_CONTACT)
-        assert home.is_visible(home.NAV_ABOUT_US)
-        assert home.is_visible(home.NAV_CART)
+        home.assert_nav_bar_loaded()
 
     @pytest.mark.ui
     @pytest.mark.slow
@@ -99,29 +98,31 @@ class TestHomePageEdgeCases:
         home = HomePage(page).open()
         
         # Rapidly click next button
-        for _ in range(3):
-            if home.is_next_button_enabled():
-                home.click_next_page()
-                assert home.get_product_count() > 0
+        counts = home.paginate_and_collect(3)
+        assert all(count > 0 for count in counts)
 
+    @pytest.mark.usefixtures("mock_category_api")
     @pytest.mark.ui
-    def test_category_buttons_remain_functional(self, page: Page):
-        """Test category buttons work after multiple uses."""
+    @pytest.mark.parametrize(
+        "filter_method, other_method",
+        [
+            (HomePage.filter_by_phones, HomePage.filter_by_laptops),
+            (HomePage.filter_by_laptops, HomePage.filter_by_monitors),
+            (HomePage.filter_by_monitors, HomePage.filter_by_phones),
+        ],
+        ids=["phones", "laptops", "monitors"],
+    )
+    def test_category_buttons_remain_functional(self, page: Page, filter_method, other_method):
+        """Test a category button still works after switching away and back."""
         home = HomePage(page).open()
         
-        # Click each category multiple times
-        for _ in range(2):
-            home.filter_by_phones()
-            phones_count = home.get_product_count()
-            assert phones_count > 0
-            
-            home.filter_by_laptops()
-            laptops_count = home.get_product_count()
-            assert laptops_count > 0
-            
-            home.filter_by_monitors()
-            monitors_count = home.get_product_count()
-            assert monitors_count > 0
+        filter_method(home)
+        first_count = home.get_product_count()
+        assert first_count > 0
+        
+        other_method(home)
+        filter_method(home)
+        assert home.get_product_count() == first_count
 
     @pytest.mark.ui
     @pytest.mark.products
@@ -129,7 +130,6 @@ class TestHomePageEdgeCases:
         """Test all products have clickable links."""
         home = HomePage(page).open()
         
-        product_count = home.get_product_count()
-        product_links = home.count_elements(home.PRODUCT_LINKS)
+        snapshot = home.get_product_snapshot()
         
-        assert product_links == product_count, "Each product should have a link"
+        assert snapshot["links"] == snapshot["count"], "Each product should have a link"
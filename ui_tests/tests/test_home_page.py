@@ -17,71 +17,56 @@ class TestHomePageNavigation:
     @pytest.mark.smoke
     @pytest.mark.ui
     @pytest.mark.critical
-    def test_homepage_loads_successfully(self, page: Page):
+    def test_homepage_loads_successfully(self, home: HomePage):
         """Test homepage loads with all critical elements."""
-        home = HomePage(page).open()
-
         # Verify page loaded
         assert home.verify_on_homepage()
         assert "STORE" in home.get_page_title()
 
         # Verify nav elements are visible
-        assert home.is_visible(home.NAV_HOME)
-        assert home.is_visible(home.NAV_CONTACT)
-        assert home.is_visible(home.NAV_ABOUT_US)
-        assert home.is_visible(home.NAV_CART)
-        assert home.is_visible(home.NAV_LOGIN)
-        assert home.is_visible(home.NAV_SIGNUP)
+        home.assert_nav_bar_loaded()
 
     @pytest.mark.ui
-    def test_logo_click_returns_to_homepage(self, page: Page):
+    def test_logo_click_returns_to_homepage(self, home: HomePage):
         """Test clicking logo returns to homepage."""
-        home = HomePage(page).open()
-        home.filter_by_phones()  # Navigate away
+        # Move off the index URL without a network round trip
+        home.page.evaluate("() => history.pushState({}, '', 'prod.html?idp_=1')")
         home.click_logo()
+        assert home.get_current_url().endswith("/index.html")
         assert home.verify_on_homepage()
 
     @pytest.mark.ui
-    def test_cart_navigation(self, page: Page):
+    def test_cart_navigation(self, warm_page: Page):
         """Test navigation to shopping cart."""
-        home = HomePage(page).open()
+        home = HomePage(warm_page).open()
         home.goto_cart()
         assert "cart" in home.get_current_url().lower()
 
     @pytest.mark.ui
-    def test_open_login_modal(self, page: Page):
+    def test_open_login_modal(self, home: HomePage):
         """Test opening login modal."""
-        home = HomePage(page).open()
         home.open_login_modal()
-        assert home.is_visible("#logInModal")
-        assert home.is_visible("#loginusername")
-        assert home.is_visible("#loginpassword")
+        assert home.get_hidden_elements(["#logInModal", "#loginusername", "#loginpassword"]) == []
 
     @pytest.mark.ui
-    def test_open_signup_modal(self, page: Page):
+    def test_open_signup_modal(self, home: HomePage):
         """Test opening signup modal."""
-        home = HomePage(page).open()
         home.open_signup_modal()
-        assert home.is_visible("#signInModal")
-        assert home.is_visible("#sign-username")
-        assert home.is_visible("#sign-password")
+        assert home.get_hidden_elements(["#signInModal", "#sign-username", "#sign-password"]) == []
 
     @pytest.mark.ui
-    def test_open_contact_modal(self, page: Page):
+    def test_open_contact_modal(self, home: HomePage):
         """Test opening contact modal."""
-        home = HomePage(page).open()
         home.open_contact_modal()
-        assert home.is_visible("#exampleModal")
-        assert home.is_visible("#recipient-email")
-        assert home.is_visible("#recipient-name")
+        assert home.get_hidden_elements(
+            ["#exampleModal", "#recipient-email", "#recipient-name"]
+        ) == []
 
     @pytest.mark.ui
-    def test_open_about_modal(self, page: Page):
+    def test_open_about_modal(self, home: HomePage):
         """Test opening about us modal."""
-        home = HomePage(page).open()
         home.open_about_modal()
-        assert home.is_visible("#videoModal")
-        assert home.is_visible("video")
+        assert home.get_hidden_elements(["#videoModal", "video"]) == []
 
 
 class TestProductCatalog:
@@ -134,11 +119,9 @@ class TestProductCatalog:
     def test_product_count_matches_cards(self, page: Page):
         """Test product count matches number of product cards."""
         home = HomePage(page).open()
-        product_count = home.get_product_count()
-        titles = home.get_product_titles()
-        prices = home.get_product_prices()
-        assert product_count == len(titles)
-        assert product_count == len(prices)
+        snapshot = home.get_product_snapshot()
+        assert snapshot["count"] == len(snapshot["titles"])
+        assert snapshot["count"] == len(snapshot["prices"])
 
 
 class TestCategoryFilters:
@@ -172,6 +155,7 @@ class TestCategoryFilters:
         products = home.get_product_titles()
         assert len(products) > 0, "No products shown for Monitors category"
 
+    @pytest.mark.usefixtures("mock_category_api")
     @pytest.mark.ui
     @pytest.mark.products
     def test_category_filter_changes_products(self, page: Page):
@@ -192,23 +176,26 @@ class TestCategoryFilters:
         # Verify products changed
         assert phones_products != laptops_products, "Products should change between categories"
 
+    @pytest.mark.usefixtures("mock_category_api")
     @pytest.mark.ui
     @pytest.mark.products
-    def test_multiple_category_switches(self, page: Page):
-        """Test switching between multiple categories."""
+    @pytest.mark.parametrize(
+        "from_filter, to_filter",
+        [
+            (HomePage.filter_by_phones, HomePage.filter_by_laptops),
+            (HomePage.filter_by_laptops, HomePage.filter_by_monitors),
+            (HomePage.filter_by_monitors, HomePage.filter_by_phones),
+        ],
+        ids=["phones-to-laptops", "laptops-to-monitors", "monitors-to-phones"],
+    )
+    def test_multiple_category_switches(self, page: Page, from_filter, to_filter):
+        """Test switching from one category to another."""
         home = HomePage(page).open()
 
-        # Switch between categories
-        home.filter_by_phones()
+        from_filter(home)
         assert home.get_product_count() > 0
 
-        home.filter_by_laptops()
-        assert home.get_product_count() > 0
-
-        home.filter_by_monitors()
-        assert home.get_product_count() > 0
-
-        home.filter_by_phones()
+        to_filter(home)
         assert home.get_product_count() > 0
 
 
@@ -244,16 +231,10 @@ class TestPagination:
         home = HomePage(page).open()
 
         # Click next several times
-        for _ in range(3):
-            if home.is_next_button_enabled():
-                home.click_next_page()
-                assert home.get_product_count() > 0
+        assert all(count > 0 for count in home.paginate_and_collect(3))
 
         # Click previous to go back
-        for _ in range(3):
-            if home.is_previous_button_enabled():
-                home.click_previous_page()
-                assert home.get_product_count() > 0
+        assert all(count > 0 for count in home.paginate_and_collect(3, backwards=True))
 
 
 class TestUserAuthentication:
@@ -286,28 +267,17 @@ class TestResponsiveDesign:
     """Test suite for responsive design."""
 
     @pytest.mark.ui
-    @pytest.mark.mobile
-    def test_homepage_mobile_viewport(self, page: Page):
-        """Test homepage on mobile viewport."""
-        page.set_viewport_size({"width": 375, "height": 667})  # iPhone SE
-        home = HomePage(page).open()
-        assert home.verify_on_homepage()
-        assert home.get_product_count() > 0
-
-    @pytest.mark.ui
-    @pytest.mark.tablet
-    def test_homepage_tablet_viewport(self, page: Page):
-        """Test homepage on tablet viewport."""
-        page.set_viewport_size({"width": 768, "height": 1024})  # iPad
-        home = HomePage(page).open()
-        assert home.verify_on_homepage()
-        assert home.get_product_count() > 0
-
-    @pytest.mark.ui
-    @pytest.mark.desktop
-    def test_homepage_desktop_viewport(self, page: Page):
-        """Test homepage on desktop viewport."""
-        page.set_viewport_size({"width": 1920, "height": 1080})
+    @pytest.mark.parametrize(
+        "width,height",
+        [
+            pytest.param(375, 667, marks=pytest.mark.mobile, id="mobile"),  # iPhone SE
+            pytest.param(768, 1024, marks=pytest.mark.tablet, id="tablet"),  # iPad
+            pytest.param(1920, 1080, marks=pytest.mark.desktop, id="desktop"),
+        ],
+    )
+    def test_homepage_viewport(self, page: Page, width: int, height: int):
+        """Test homepage on mobile, tablet and desktop viewports."""
+        page.set_viewport_size({"width": width, "height": height})
         home = HomePage(page).open()
         assert home.verify_on_homepage()
         assert home.get_product_count() > 0
@@ -320,26 +290,30 @@ class TestPagePerformance:
     @pytest.mark.performance
     def test_homepage_load_time(self, page: Page):
         """Test homepage loads within acceptable time."""
-        import time
-
-        start_time = time.time()
         home = HomePage(page).open()
-        load_time = time.time() - start_time
 
-        assert load_time < 5.0, f"Homepage took {load_time}s to load"
+        # Browser-side Navigation Timing, relative to navigation start
+        load_time_ms = page.evaluate(
+            "() => performance.getEntriesByType('navigation')[0].domContentLoadedEventEnd"
+        )
+
+        assert load_time_ms < 5000, f"Homepage took {load_time_ms:.0f}ms to load"
         assert home.verify_on_homepage()
 
     @pytest.mark.ui
     @pytest.mark.performance
     def test_product_filtering_performance(self, page: Page):
         """Test category filtering responds quickly."""
-        import time
-
         home = HomePage(page).open()
 
-        start_time = time.time()
+        page.evaluate("() => performance.mark('filter_start')")
         home.filter_by_phones()
-        filter_time = time.time() - start_time
-
-        assert filter_time < 3.0, f"Filtering took {filter_time}s"
+        filter_time_ms = page.evaluate(
+            """() => {
+                performance.mark('filter_end');
+                return performance.measure('filter', 'filter_start', 'filter_end').duration;
+            }"""
+        )
+
+        assert filter_time_ms < 3000, f"Filtering took {filter_time_ms:.0f}ms"
         assert home.get_product_count() > 0
@@ -11,6 +11,21 @@ from ui_tests.pages.home_page import HomePage
 from ui_tests.pages.login_page import LoginPage
 
 
+@pytest.fixture
+def login(page: Page) -> LoginPage:
+    """
+    Login page object with the home page already open.
+
+    Args:
+        page: Playwright page instance
+
+    Returns:
+        LoginPage bound to the page
+    """
+    HomePage(page).open()
+    return LoginPage(page)
+
+
 class TestLoginModal:
     """Test suite for login modal functionality."""
 
@@ -18,23 +33,19 @@ class TestLoginModal:
     @pytest.mark.ui
     @pytest.mark.auth
     @pytest.mark.critical
-    def test_open_login_modal(self, page: Page):
+    def test_open_login_modal(self, login: LoginPage):
         """Test opening login modal from homepage."""
-        home = HomePage(page).open()
-        login = LoginPage(page)
         login.open_login_modal()
 
         assert login.is_login_modal_open()
-        assert login.is_visible(login.LOGIN_USERNAME_INPUT)
-        assert login.is_visible(login.LOGIN_PASSWORD_INPUT)
-        assert login.is_visible(login.LOGIN_BUTTON)
+        assert login.get_hidden_elements(
+            [login.LOGIN_USERNAME_INPUT, login.LOGIN_PASSWORD_INPUT, login.LOGIN_BUTTON]
+        ) == []
 
     @pytest.mark.ui
     @pytest.mark.auth
-    def test_login_modal_title(self, page: Page):
+    def test_login_modal_title(self, login: LoginPage):
         """Test login modal displays correct title."""
-        home = HomePage(page).open()
-        login = LoginPage(page)
         login.open_login_modal()
 
         title = login.get_login_modal_title()
@@ -42,10 +53,8 @@ class TestLoginModal:
 
     @pytest.mark.ui
     @pytest.mark.auth
-    def test_close_login_modal(self, page: Page):
+    def test_close_login_modal(self, login: LoginPage):
         """Test closing login modal."""
-        home = HomePage(page).open()
-        login = LoginPage(page)
         login.open_login_modal()
         assert login.is_login_modal_open()
 
@@ -54,10 +63,8 @@ class TestLoginModal:
 
     @pytest.mark.ui
     @pytest.mark.auth
-    def test_login_modal_fields_are_empty(self, page: Page):
+    def test_login_modal_fields_are_empty(self, login: LoginPage):
         """Test login modal fields are initially empty."""
-        home = HomePage(page).open()
-        login = LoginPage(page)
         login.open_login_modal()
 
         username_value = login.get_value(login.LOGIN_USERNAME_INPUT)
@@ -68,10 +75,8 @@ class TestLoginModal:
 
     @pytest.mark.ui
     @pytest.mark.auth
-    def test_login_button_enabled_by_default(self, page: Page):
+    def test_login_button_enabled_by_default(self, login: LoginPage):
         """Test login button is enabled by default."""
-        home = HomePage(page).open()
-        login = LoginPage(page)
         login.open_login_modal()
 
         assert login.is_login_button_enabled()
@@ -83,23 +88,19 @@ class TestSignupModal:
     @pytest.mark.smoke
     @pytest.mark.ui
     @pytest.mark.auth
-    def test_open_signup_modal(self, page: Page):
+    def test_open_signup_modal(self, login: LoginPage):
         """Test opening signup modal from homepage."""
-        home = HomePage(page).open()
-        login = LoginPage(page)
         login.open_signup_modal()
 
         assert login.is_signup_modal_open()
-        assert login.is_visible(login.SIGNUP_USERNAME_INPUT)
-        assert login.is_visible(login.SIGNUP_PASSWORD_INPUT)
-        assert login.is_visible(login.SIGNUP_BUTTON)
+        assert login.get_hidden_elements(
+            [login.SIGNUP_USERNAME_INPUT, login.SIGNUP_PASSWORD_INPUT, login.SIGNUP_BUTTON]
+        ) == []
 
     @pytest.mark.ui
     @pytest.mark.auth
-    def test_signup_modal_title(self, page: Page):
+    def test_signup_modal_title(self, login: LoginPage):
         """Test signup modal displays correct title."""
-        home = HomePage(page).open()
-        login = LoginPage(page)
         login.open_signup_modal()
 
         title = login.get_signup_modal_title()
@@ -107,10 +108,8 @@ class TestSignupModal:
 
     @pytest.mark.ui
     @pytest.mark.auth
-    def test_close_signup_modal(self, page: Page):
+    def test_close_signup_modal(self, login: LoginPage):
         """Test closing signup modal."""
-        home = HomePage(page).open()
-        login = LoginPage(page)
         login.open_signup_modal()
         assert login.is_signup_modal_open()
 
@@ -119,10 +118,8 @@ class TestSignupModal:
 
     @pytest.mark.ui
     @pytest.mark.auth
-    def test_signup_button_enabled_by_default(self, page: Page):
+    def test_signup_button_enabled_by_default(self, login: LoginPage):
         """Test signup button is enabled by default."""
-        home = HomePage(page).open()
-        login = LoginPage(page)
         login.open_signup_modal()
 
         assert login.is_signup_button_enabled()
@@ -133,11 +130,9 @@ class TestLoginFunctionality:
 
     @pytest.mark.ui
     @pytest.mark.auth
-    def test_fill_login_username_field(self, page: Page):
+    def test_fill_login_username_field(self, login_modal_open: LoginPage):
         """Test filling login username field."""
-        home = HomePage(page).open()
-        login = LoginPage(page)
-        login.open_login_modal()
+        login = login_modal_open
 
         test_username = "testuser123"
         login.fill_login_username(test_username)
@@ -147,11 +142,9 @@ class TestLoginFunctionality:
 
     @pytest.mark.ui
     @pytest.mark.auth
-    def test_fill_login_password_field(self, page: Page):
+    def test_fill_login_password_field(self, login_modal_open: LoginPage):
         """Test filling login password field."""
-        home = HomePage(page).open()
-        login = LoginPage(page)
-        login.open_login_modal()
+        login = login_modal_open
 
         test_password = "testpass123"
         login.fill_login_password(test_password)
@@ -161,11 +154,9 @@ class TestLoginFunctionality:
 
     @pytest.mark.ui
     @pytest.mark.auth
-    def test_fill_both_login_fields(self, page: Page):
+    def test_fill_both_login_fields(self, login_modal_open: LoginPage):
         """Test filling both username and password fields."""
-        home = HomePage(page).open()
-        login = LoginPage(page)
-        login.open_login_modal()
+        login = login_modal_open
 
         test_username = "testuser123"
         test_password = "testpass123"
@@ -185,10 +176,8 @@ class TestSignupFunctionality:
 
     @pytest.mark.ui
     @pytest.mark.auth
-    def test_fill_signup_username_field(self, page: Page):
+    def test_fill_signup_username_field(self, login: LoginPage):
         """Test filling signup username field."""
-        home = HomePage(page).open()
-        login = LoginPage(page)
         login.open_signup_modal()
 
         test_username = "newuser123"
@@ -199,10 +188,8 @@ class TestSignupFunctionality:
 
     @pytest.mark.ui
     @pytest.mark.auth
-    def test_fill_signup_password_field(self, page: Page):
+    def test_fill_signup_password_field(self, login: LoginPage):
         """Test filling signup password field."""
-        home = HomePage(page).open()
-        login = LoginPage(page)
         login.open_signup_modal()
 
         test_password = "newpass123"
@@ -213,10 +200,8 @@ class TestSignupFunctionality:
 
     @pytest.mark.ui
     @pytest.mark.auth
-    def test_fill_both_signup_fields(self, page: Page):
+    def test_fill_both_signup_fields(self, login: LoginPage):
         """Test filling both signup username and password fields."""
-        home = HomePage(page).open()
-        login = LoginPage(page)
         login.open_signup_modal()
 
         test_username = "newuser123"
@@ -237,40 +222,15 @@ class TestAuthenticationState:
 
     @pytest.mark.ui
     @pytest.mark.auth
-    def test_user_not_logged_in_initially(self, page: Page):
-        """Test user is not logged in when visiting homepage."""
-        home = HomePage(page).open()
-        login = LoginPage(page)
+    def test_logged_out_nav_state(self, login: LoginPage):
+        """Test a fresh visitor is logged out and sees login/signup but not logout."""
+        state = login.get_auth_state()
 
-        assert not login.is_logged_in()
+        assert not state["logged_in"]
         assert login.get_logged_in_username() is None
-
-    @pytest.mark.ui
-    @pytest.mark.auth
-    def test_login_link_visible_when_not_logged_in(self, page: Page):
-        """Test login link is visible when not logged in."""
-        home = HomePage(page).open()
-        login = LoginPage(page)
-
-        assert login.is_visible(login.NAV_LOGIN_LINK)
-
-    @pytest.mark.ui
-    @pytest.mark.auth
-    def test_signup_link_visible_when_not_logged_in(self, page: Page):
-        """Test signup link is visible when not logged in."""
-        home = HomePage(page).open()
-        login = LoginPage(page)
-
-        assert login.is_visible(login.NAV_SIGNUP_LINK)
-
-    @pytest.mark.ui
-    @pytest.mark.auth
-    def test_logout_link_not_visible_when_not_logged_in(self, page: Page):
-        """Test logout link is not visible when not logged in."""
-        home = HomePage(page).open()
-        login = LoginPage(page)
-
-        assert not login.is_visible(login.NAV_LOGOUT_LINK, timeout=2000)
+        assert state["login_link_visible"]
+        assert state["signup_link_visible"]
+        assert not state["logout_link_visible"]
 
 
 class TestModalBehavior:
@@ -278,11 +238,8 @@ class TestModalBehavior:
 
     @pytest.mark.ui
     @pytest.mark.auth
-    def test_cannot_open_both_modals_simultaneously(self, page: Page):
+    def test_cannot_open_both_modals_simultaneously(self, login: LoginPage):
         """Test that only one modal can be open at a time."""
-        home = HomePage(page).open()
-        login = LoginPage(page)
-
         # Open login modal
         login.open_login_modal()
         assert login.is_login_modal_open()
@@ -291,5 +248,6 @@ class TestModalBehavior:
         login.close_login_modal()
         login.open_signup_modal()
 
-        assert login.is_signup_modal_open()
-        assert not login.is_login_modal_open()
+        state = login.get_auth_state()
+        assert state["signup_modal_open"]
+        assert not state["login_modal_open"]
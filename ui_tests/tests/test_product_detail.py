@@ -29,76 +29,26 @@ class TestProductDetailPage:
 
     @pytest.mark.ui
     @pytest.mark.products
-    def test_product_name_is_displayed(self, page: Page):
-        """Test product name is displayed on detail page."""
-        home = HomePage(page).open()
-        home.click_product_by_index(0)
-
-        product_detail = ProductDetailPage(page)
-        product_name = product_detail.get_product_name()
-
+    def test_product_information_is_displayed(self, product_page: ProductDetailPage):
+        """Test name, price, description and image are all shown on one page load."""
+        product_name = product_page.get_product_name()
         assert product_name is not None
         assert len(product_name) > 0
 
-    @pytest.mark.ui
-    @pytest.mark.products
-    def test_product_price_is_displayed(self, page: Page):
-        """Test product price is displayed on detail page."""
-        home = HomePage(page).open()
-        home.click_product_by_index(0)
-
-        product_detail = ProductDetailPage(page)
-        product_price = product_detail.get_product_price()
-
+        product_price = product_page.get_product_price()
         assert product_price is not None
         assert len(product_price) > 0
 
-    @pytest.mark.ui
-    @pytest.mark.products
-    def test_product_description_is_displayed(self, page: Page):
-        """Test product description is displayed on detail page."""
-        home = HomePage(page).open()
-        home.click_product_by_index(0)
-
-        product_detail = ProductDetailPage(page)
-        description = product_detail.get_product_description()
-
+        description = product_page.get_product_description()
         assert description is not None
         assert len(description) > 0
 
-    @pytest.mark.ui
-    @pytest.mark.products
-    def test_product_image_is_visible(self, page: Page):
-        """Test product image is visible on detail page."""
-        home = HomePage(page).open()
-        home.click_product_by_index(0)
-
-        product_detail = ProductDetailPage(page)
-        assert product_detail.is_product_image_visible()
-
-    @pytest.mark.ui
-    @pytest.mark.products
-    def test_product_image_has_src(self, page: Page):
-        """Test product image has valid source URL."""
-        home = HomePage(page).open()
-        home.click_product_by_index(0)
-
-        product_detail = ProductDetailPage(page)
-        image_src = product_detail.get_product_image_src()
-
+        assert product_page.is_product_image_visible()
+        image_src = product_page.get_product_image_src()
         assert image_src is not None
-        assert len(image_src) > 0
         assert image_src.startswith("http")
 
-    @pytest.mark.ui
-    @pytest.mark.products
-    def test_all_product_information_present(self, page: Page):
-        """Test all product information elements are present."""
-        home = HomePage(page).open()
-        home.click_product_by_index(0)
-
-        product_detail = ProductDetailPage(page)
-        assert product_detail.has_product_information()
+        assert product_page.has_product_information()
 
 
 class TestProductPricing:
@@ -106,33 +56,21 @@ class TestProductPricing:
 
     @pytest.mark.ui
     @pytest.mark.products
-    def test_product_price_format(self, page: Page):
+    def test_product_price_format(self, product_page: ProductDetailPage):
         """Test product price has correct format with $ symbol."""
-        home = HomePage(page).open()
-        home.click_product_by_index(0)
-
-        product_detail = ProductDetailPage(page)
-        assert product_detail.verify_product_price_format()
+        assert product_page.verify_product_price_format()
 
     @pytest.mark.ui
     @pytest.mark.products
-    def test_product_price_is_positive(self, page: Page):
+    def test_product_price_is_positive(self, product_page: ProductDetailPage):
         """Test product price is a positive number."""
-        home = HomePage(page).open()
-        home.click_product_by_index(0)
-
-        product_detail = ProductDetailPage(page)
-        assert product_detail.verify_product_price_is_positive()
+        assert product_page.verify_product_price_is_positive()
 
     @pytest.mark.ui
     @pytest.mark.products
-    def test_product_price_value_extraction(self, page: Page):
+    def test_product_price_value_extraction(self, product_page: ProductDetailPage):
         """Test extracting numeric price value."""
-        home = HomePage(page).open()
-        home.click_product_by_index(0)
-
-        product_detail = ProductDetailPage(page)
-        price_value = product_detail.get_product_price_value()
+        price_value = product_page.get_product_price_value()
 
         assert isinstance(price_value, float)
         assert price_value > 0
@@ -146,36 +84,24 @@ class TestAddToCart:
     @pytest.mark.ui
     @pytest.mark.critical
     @pytest.mark.cart
-    def test_add_to_cart_button_visible(self, page: Page):
+    def test_add_to_cart_button_visible(self, product_page: ProductDetailPage):
         """Test add to cart button is visible on product detail page."""
-        home = HomePage(page).open()
-        home.click_product_by_index(0)
-
-        product_detail = ProductDetailPage(page)
-        assert product_detail.is_add_to_cart_button_visible()
+        assert product_page.is_add_to_cart_button_visible()
 
     @pytest.mark.ui
     @pytest.mark.cart
-    def test_click_add_to_cart_button(self, page: Page):
+    def test_click_add_to_cart_button(self, product_page: ProductDetailPage):
         """Test clicking add to cart button."""
-        home = HomePage(page).open()
-        home.click_product_by_index(0)
-
-        product_detail = ProductDetailPage(page)
-        alert_text = product_detail.add_to_cart_and_get_alert_text()
+        alert_text = product_page.add_to_cart_and_get_alert_text()
 
         assert alert_text is not None
         assert len(alert_text) > 0
 
     @pytest.mark.ui
     @pytest.mark.cart
-    def test_add_to_cart_success_message(self, page: Page):
+    def test_add_to_cart_success_message(self, product_page: ProductDetailPage):
         """Test successful add to cart shows success message."""
-        home = HomePage(page).open()
-        home.click_product_by_index(0)
-
-        product_detail = ProductDetailPage(page)
-        alert_text = product_detail.add_to_cart_and_get_alert_text()
+        alert_text = product_page.add_to_cart_and_get_alert_text()
 
         assert "added" in alert_text.lower() or "success" in alert_text.lower()
 
@@ -191,7 +117,7 @@ class TestProductNavigation:
         home.click_product_by_index(0)
 
         product_detail = ProductDetailPage(page)
-        assert product_detail.is_on_product_detail_page()
+        assert product_detail.is_on_product_detail_page(quick=True)
 
         product_detail.go_to_home()
         assert home.verify_on_homepage()
@@ -222,27 +148,21 @@ class TestProductDetailResponsive:
     @pytest.mark.ui
     @pytest.mark.products
     @pytest.mark.mobile
-    def test_product_detail_mobile_view(self, page: Page):
+    def test_product_detail_mobile_view(self, page: Page, first_product_path: str):
         """Test product detail page on mobile viewport."""
         page.set_viewport_size({"width": 375, "height": 667})
 
-        home = HomePage(page).open()
-        home.click_product_by_index(0)
-
-        product_detail = ProductDetailPage(page)
-        assert product_detail.is_on_product_detail_page()
+        product_detail = ProductDetailPage(page).open(first_product_path)
+        assert product_detail.is_on_product_detail_page(quick=True)
         assert product_detail.has_product_information()
 
     @pytest.mark.ui
     @pytest.mark.products
     @pytest.mark.tablet
-    def test_product_detail_tablet_view(self, page: Page):
+    def test_product_detail_tablet_view(self, page: Page, first_product_path: str):
         """Test product detail page on tablet viewport."""
         page.set_viewport_size({"width": 768, "height": 1024})
 
-        home = HomePage(page).open()
-        home.click_product_by_index(0)
-
-        product_detail = ProductDetailPage(page)
-        assert product_detail.is_on_product_detail_page()
+        product_detail = ProductDetailPage(page).open(first_product_path)
+        assert product_detail.is_on_product_detail_page(quick=True)
         assert product_detail.has_product_information()
@@ -5,16 +5,61 @@ Provides structured logging with different log levels and formatters
 for console and file output.
 """
 
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from config.settings import settings
 
+# Neither log format uses thread/process fields; skip collecting them on every record.
+# These are process-wide logging switches, so they are set once at import.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 
-class ColoredFormatter(logging.Formatter):
+# Background listeners writing each logger's file output, keyed by logger name
+_file_listeners: Dict[str, QueueListener] = {}
+
+
+def _stop_file_listeners() -> None:
+    """Flush and stop all background file-logging listeners."""
+    for listener in _file_listeners.values():
+        listener.stop()
+    _file_listeners.clear()
+
+
+atexit.register(_stop_file_listeners)
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders each wall-clock second's timestamp only once."""
+
+    def __init__(self, *args, **kwargs):
+        """Initialize formatter with an empty timestamp cache."""
+        super().__init__(*args, **kwargs)
+        self._cached_second = -1
+        self._cached_time = ""
+
+    def formatTime(self, record, datefmt=None):
+        """Format record time, reusing the last string while the second is unchanged."""
+        datefmt = datefmt or self.datefmt
+        if not datefmt:
+            # The default format includes milliseconds, so it cannot be cached per second
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = time.strftime(datefmt, self.converter(second))
+            self._cached_second = second
+        return self._cached_time
+
+
+class ColoredFormatter(CachedTimeFormatter):
     """Custom formatter with colored output for console."""
 
     COLORS = {
@@ -26,25 +71,36 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = "\033[0m"
 
+    def __init__(self, *args, **kwargs):
+        """Initialize formatter and precompute the colored level names."""
+        super().__init__(*args, **kwargs)
+        self._colored = {
+            level: f"{color}{level}{self.RESET}" for level, color in self.COLORS.items()
+        }
+
     def format(self, record):
         """Format log record with colors."""
-        log_color = self.COLORS.get(record.levelname, self.RESET)
-        record.levelname = f"{log_color}{record.levelname}{self.RESET}"
-        return super().format(record)
+        levelname = record.levelname
+        record.levelname = self._colored.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            # The record is shared with the file handler, which must not get color codes
+            record.levelname = levelname
 
 
-def setup_logger(
-    name: str = "E-Commerce-Tests",
-    log_level: Optional[str] = None,
-    log_file: Optional[Path] = None,
+DEFAULT_LOGGER_NAME = "E-Commerce-Tests"
+
+
+def setup_console_logger(
+    name: str = DEFAULT_LOGGER_NAME, log_level: Optional[str] = None
 ) -> logging.Logger:
     """
-    Set up logger with console and file handlers.
+    Set up logger with a colored console handler only.
 
     Args:
         name: Logger name
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-        log_file: Path to log file (optional)
 
     Returns:
         Configured logger instance
@@ -57,33 +113,81 @@ def setup_logger(
 
     # Remove existing handlers
     logger.handlers.clear()
+    previous_listener = _file_listeners.pop(name, None)
+    if previous_listener:
+        previous_listener.stop()
 
     # Console handler with colored output
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
-    console_format = ColoredFormatter(
-        "%(asctime)s [%(levelname)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-    )
+    console_fmt = "%(asctime)s [%(levelname)s] %(message)s"
+    if "pytest" in sys.modules:
+        # pytest's live logging already prints INFO records that propagate to the root
+        console_handler.setLevel(logging.WARNING)
+        console_format = CachedTimeFormatter(console_fmt, datefmt="%Y-%m-%d %H:%M:%S")
+    else:
+        console_handler.setLevel(logging.INFO)
+        console_format = ColoredFormatter(console_fmt, datefmt="%Y-%m-%d %H:%M:%S")
     console_handler.setFormatter(console_format)
     logger.addHandler(console_handler)
 
-    # File handler with detailed output
-    if log_file or settings.log_dir:
-        log_path = log_file or settings.log_dir / f"{name.lower().replace(' ', '_')}.log"
+    return logger
+
+
+def attach_file_handler(logger: logging.Logger, log_file: Optional[Path] = None) -> None:
+    """
+    Attach a rotating file handler to a logger, written from a background thread.
+
+    Args:
+        logger: Logger to attach the handler to
+        log_file: Path to log file (defaults to a file named after the logger in log_dir)
+    """
+    if logger.name in _file_listeners:
+        return
+
+    log_path = log_file or settings.log_dir / f"{logger.name.lower().replace(' ', '_')}.log"
+    if not log_path.parent.exists():
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        file_handler = RotatingFileHandler(
-            log_path,
-            maxBytes=settings.log_file_max_bytes,
-            backupCount=settings.log_backup_count,
-        )
-        file_handler.setLevel(logging.DEBUG)
-        file_format = logging.Formatter(
-            "%(asctime)s [%(levelname)8s] [%(filename)s:%(lineno)d] %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-        file_handler.setFormatter(file_format)
-        logger.addHandler(file_handler)
+    file_handler = RotatingFileHandler(
+        log_path,
+        maxBytes=settings.log_file_max_bytes,
+        backupCount=settings.log_backup_count,
+    )
+    file_handler.setLevel(logging.DEBUG)
+    file_format = CachedTimeFormatter(
+        "%(asctime)s [%(levelname)8s] [%(filename)s:%(lineno)d] %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    file_handler.setFormatter(file_format)
+
+    # Disk writes and rotation checks happen on a background thread
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    _file_listeners[logger.name] = listener
+
+
+def setup_logger(
+    name: str = DEFAULT_LOGGER_NAME,
+    log_level: Optional[str] = None,
+    log_file: Optional[Path] = None,
+) -> logging.Logger:
+    """
+    Set up logger with console and file handlers.
+
+    Args:
+        name: Logger name
+        log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        log_file: Path to log file (optional)
+
+    Returns:
+        Configured logger instance
+    """
+    logger = setup_console_logger(name, log_level)
+
+    if log_file or settings.enable_file_logging:
+        attach_file_handler(logger, log_file)
 
     return logger
 
@@ -92,6 +196,6 @@ def setup_logger(
 logger = setup_logger()
 
 
-def get_logger(name: str = "E-Commerce-Tests") -> logging.Logger:
+def get_logger(name: str = DEFAULT_LOGGER_NAME) -> logging.Logger:
     """Get logger instance."""
     return logging.getLogger(name)
@@ -5,31 +5,172 @@ Tests for visual consistency across browsers, viewports,
 and page states using screenshot comparison.
 """
 
+from pathlib import Path
+from typing import Generator
+
 import pytest
-from playwright.sync_api import Page
+from playwright.sync_api import Browser, BrowserContext, Page, Playwright
 
 from config.settings import settings
-from visual.utils.screenshot_compare import ScreenshotCompare
 
 
 @pytest.fixture
 def screenshot_compare():
     """Create screenshot comparison utility."""
+    from visual.utils.screenshot_compare import ScreenshotCompare
+
     return ScreenshotCompare()
 
 
+@pytest.fixture(scope="session")
+def browser(
+    playwright_instance: Playwright, browser_type_name: str
+) -> Generator[Browser, None, None]:
+    """
+    Session-scoped browser launched with the visual regression configuration.
+
+    Args:
+        playwright_instance: Playwright instance
+        browser_type_name: Browser type (chromium, firefox, webkit)
+
+    Yields:
+        Browser instance
+    """
+    browser_type = getattr(playwright_instance, browser_type_name)
+    browser_instance = browser_type.launch(**settings.get_visual_playwright_config())
+
+    yield browser_instance
+
+    browser_instance.close()
+
+
+# Smooth scrolling would leave full-page captures mid-scroll
+_DISABLE_SMOOTH_SCROLL_SCRIPT = """
+document.addEventListener("DOMContentLoaded", () => {
+    document.documentElement.style.scrollBehavior = "auto";
+});
+"""
+
+
+def _new_visual_context(browser: Browser) -> BrowserContext:
+    """
+    Create a browser context that renders deterministically for screenshots.
+
+    Reduced motion collapses CSS transitions that honour prefers-reduced-motion,
+    and the color scheme is pinned so OS settings cannot change the page.
+
+    Args:
+        browser: Browser instance
+
+    Returns:
+        New browser context
+    """
+    visual_context = browser.new_context(
+        viewport=settings.get_browser_dimensions(),
+        reduced_motion="reduce",
+        color_scheme="light",
+        record_video_dir=str(settings.report_dir / "videos")
+        if settings.capture_videos
+        else None,
+    )
+    visual_context.add_init_script(_DISABLE_SMOOTH_SCROLL_SCRIPT)
+    return visual_context
+
+
+@pytest.fixture
+def context(browser: Browser) -> Generator[BrowserContext, None, None]:
+    """
+    Function-scoped browser context for visual tests.
+
+    Overrides the root fixture so every ``page`` here uses the deterministic
+    rendering settings.
+
+    Args:
+        browser: Browser instance
+
+    Yields:
+        Browser context
+    """
+    visual_context = _new_visual_context(browser)
+
+    yield visual_context
+
+    visual_context.close()
+
+
+@pytest.fixture
+def visual_temp_dir(worker_id: str) -> Path:
+    """
+    Per-worker scratch directory for captured screenshots.
+
+    Keeps parallel xdist workers from writing to the same file.
+
+    Args:
+        worker_id: xdist worker id ("master" when not distributed)
+
+    Returns:
+        Directory for this worker's screenshots
+    """
+    path = Path("visual/temp") / worker_id
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+@pytest.fixture(scope="class")
+def homepage_page(browser: Browser) -> Generator[Page, None, None]:
+    """
+    Homepage loaded once and shared by a test class's static components.
+
+    Only use it for tests that screenshot without changing the page.
+
+    Args:
+        browser: Browser instance
+
+    Yields:
+        Page with the homepage fully rendered
+    """
+    shared_context = _new_visual_context(browser)
+    shared_page = shared_context.new_page()
+    shared_page.set_default_timeout(settings.default_timeout)
+    shared_page.set_default_navigation_timeout(settings.navigation_timeout)
+    shared_page.goto(settings.base_url)
+    _wait_for_visual_ready(shared_page, "#tbodyid .card")
+
+    yield shared_page
+
+    shared_context.close()
+
+
+def _wait_for_visual_ready(page: Page, selector: str) -> None:
+    """
+    Wait until a component is rendered and safe to screenshot.
+
+    Waits for the component itself, then for every image and web font on
+    the page to finish loading, instead of a blanket network-idle window.
+
+    Args:
+        page: Playwright page instance
+        selector: Last-to-render element of the component under test
+    """
+    page.wait_for_selector(selector, state="visible")
+    page.wait_for_function(
+        """() => document.fonts.status === "loaded"
+            && Array.from(document.images).every((img) => img.complete)"""
+    )
+
+
 class TestPageVisualRegression:
     """Test visual consistency of full pages."""
 
     @pytest.mark.visual
     @pytest.mark.ui
-    def test_homepage_visual_desktop(self, page: Page, screenshot_compare):
+    def test_homepage_visual_desktop(self, page: Page, screenshot_compare, visual_temp_dir):
         """Test homepage visual consistency on desktop."""
         page.goto(settings.base_url)
-        page.wait_for_load_state("networkidle")
+        _wait_for_visual_ready(page, "#tbodyid .card")
 
-        screenshot_path = "visual/temp/homepage_desktop.png"
-        page.screenshot(path=screenshot_path, full_page=True)
+        screenshot_path = str(visual_temp_dir / "homepage_desktop.png")
+        page.screenshot(path=screenshot_path)
 
         is_similar, diff, _ = screenshot_compare.compare_with_baseline(
             screenshot_path, "homepage_desktop", threshold=0.05
@@ -39,14 +180,14 @@ class TestPageVisualRegression:
 
     @pytest.mark.visual
     @pytest.mark.mobile
-    def test_homepage_visual_mobile(self, page: Page, screenshot_compare):
+    def test_homepage_visual_mobile(self, page: Page, screenshot_compare, visual_temp_dir):
         """Test homepage visual consistency on mobile."""
         page.set_viewport_size({"width": 375, "height": 667})
         page.goto(settings.base_url)
-        page.wait_for_load_state("networkidle")
+        _wait_for_visual_ready(page, "#tbodyid .card")
 
-        screenshot_path = "visual/temp/homepage_mobile.png"
-        page.screenshot(path=screenshot_path, full_page=True)
+        screenshot_path = str(visual_temp_dir / "homepage_mobile.jpg")
+        page.screenshot(path=screenshot_path, full_page=True, type="jpeg", quality=90)
 
         is_similar, diff, _ = screenshot_compare.compare_with_baseline(
             screenshot_path, "homepage_mobile", threshold=0.05
@@ -56,14 +197,14 @@ class TestPageVisualRegression:
 
     @pytest.mark.visual
     @pytest.mark.tablet
-    def test_homepage_visual_tablet(self, page: Page, screenshot_compare):
+    def test_homepage_visual_tablet(self, page: Page, screenshot_compare, visual_temp_dir):
         """Test homepage visual consistency on tablet."""
         page.set_viewport_size({"width": 768, "height": 1024})
         page.goto(settings.base_url)
-        page.wait_for_load_state("networkidle")
+        _wait_for_visual_ready(page, "#tbodyid .card")
 
-        screenshot_path = "visual/temp/homepage_tablet.png"
-        page.screenshot(path=screenshot_path, full_page=True)
+        screenshot_path = str(visual_temp_dir / "homepage_tablet.jpg")
+        page.screenshot(path=screenshot_path, full_page=True, type="jpeg", quality=90)
 
         is_similar, diff, _ = screenshot_compare.compare_with_baseline(
             screenshot_path, "homepage_tablet", threshold=0.05
@@ -73,34 +214,14 @@ class TestPageVisualRegression:
 
     @pytest.mark.visual
     @pytest.mark.ui
-    def test_product_page_visual(self, page: Page, screenshot_compare):
-        """Test product detail page visual consistency."""
-        page.goto(settings.base_url)
-        page.wait_for_load_state("networkidle")
-
-        # Click first product
-        page.click(".card-title a >> nth=0")
-        page.wait_for_selector("#tbodyid")
-
-        screenshot_path = "visual/temp/product_page.png"
-        page.screenshot(path=screenshot_path, full_page=True)
-
-        is_similar, diff, _ = screenshot_compare.compare_with_baseline(
-            screenshot_path, "product_page", threshold=0.05
-        )
-
-        assert is_similar, f"Product page regression: {diff:.2%} difference"
-
-    @pytest.mark.visual
-    @pytest.mark.ui
-    def test_cart_page_visual(self, page: Page, screenshot_compare):
+    def test_cart_page_visual(self, page: Page, screenshot_compare, visual_temp_dir):
         """Test cart page visual consistency."""
         page.goto(settings.base_url)
         page.click("#cartur")
         page.wait_for_selector("#tbodyid")
 
-        screenshot_path = "visual/temp/cart_page.png"
-        page.screenshot(path=screenshot_path, full_page=True)
+        screenshot_path = str(visual_temp_dir / "cart_page.png")
+        page.screenshot(path=screenshot_path)
 
         is_similar, diff, _ = screenshot_compare.compare_with_baseline(
             screenshot_path, "cart_page", threshold=0.05
@@ -114,13 +235,10 @@ class TestComponentVisualRegression:
 
     @pytest.mark.visual
     @pytest.mark.ui
-    def test_navbar_visual(self, page: Page, screenshot_compare):
+    def test_navbar_visual(self, homepage_page: Page, screenshot_compare, visual_temp_dir):
         """Test navbar visual consistency."""
-        page.goto(settings.base_url)
-        page.wait_for_load_state("networkidle")
-
-        navbar = page.locator("nav.navbar")
-        screenshot_path = "visual/temp/navbar.png"
+        navbar = homepage_page.locator("nav.navbar")
+        screenshot_path = str(visual_temp_dir / "navbar.png")
         navbar.screenshot(path=screenshot_path)
 
         is_similar, diff, _ = screenshot_compare.compare_with_baseline(
@@ -131,13 +249,10 @@ class TestComponentVisualRegression:
 
     @pytest.mark.visual
     @pytest.mark.ui
-    def test_product_card_visual(self, page: Page, screenshot_compare):
+    def test_product_card_visual(self, homepage_page: Page, screenshot_compare, visual_temp_dir):
         """Test product card visual consistency."""
-        page.goto(settings.base_url)
-        page.wait_for_load_state("networkidle")
-
-        card = page.locator(".card").first
-        screenshot_path = "visual/temp/product_card.png"
+        card = homepage_page.locator(".card").first
+        screenshot_path = str(visual_temp_dir / "product_card.png")
         card.screenshot(path=screenshot_path)
 
         is_similar, diff, _ = screenshot_compare.compare_with_baseline(
@@ -148,13 +263,10 @@ class TestComponentVisualRegression:
 
     @pytest.mark.visual
     @pytest.mark.ui
-    def test_footer_visual(self, page: Page, screenshot_compare):
+    def test_footer_visual(self, homepage_page: Page, screenshot_compare, visual_temp_dir):
         """Test footer visual consistency."""
-        page.goto(settings.base_url)
-        page.wait_for_load_state("networkidle")
-
-        footer = page.locator("#fotcont")
-        screenshot_path = "visual/temp/footer.png"
+        footer = homepage_page.locator("#fotcont")
+        screenshot_path = str(visual_temp_dir / "footer.png")
         footer.screenshot(path=screenshot_path)
 
         is_similar, diff, _ = screenshot_compare.compare_with_baseline(
@@ -165,13 +277,12 @@ class TestComponentVisualRegression:
 
     @pytest.mark.visual
     @pytest.mark.ui
-    def test_category_sidebar_visual(self, page: Page, screenshot_compare):
+    def test_category_sidebar_visual(
+        self, homepage_page: Page, screenshot_compare, visual_temp_dir
+    ):
         """Test category sidebar visual consistency."""
-        page.goto(settings.base_url)
-        page.wait_for_load_state("networkidle")
-
-        sidebar = page.locator("#cat")
-        screenshot_path = "visual/temp/sidebar.png"
+        sidebar = homepage_page.locator("#cat")
+        screenshot_path = str(visual_temp_dir / "sidebar.png")
         sidebar.screenshot(path=screenshot_path)
 
         is_similar, diff, _ = screenshot_compare.compare_with_baseline(
@@ -182,13 +293,13 @@ class TestComponentVisualRegression:
 
     @pytest.mark.visual
     @pytest.mark.ui
-    def test_carousel_visual(self, page: Page, screenshot_compare):
+    def test_carousel_visual(self, page: Page, screenshot_compare, visual_temp_dir):
         """Test carousel visual consistency."""
         page.goto(settings.base_url)
-        page.wait_for_load_state("networkidle")
+        _wait_for_visual_ready(page, "#carouselExampleIndicators .carousel-item.active img")
 
         carousel = page.locator("#carouselExampleIndicators")
-        screenshot_path = "visual/temp/carousel.png"
+        screenshot_path = str(visual_temp_dir / "carousel.png")
         carousel.screenshot(path=screenshot_path)
 
         is_similar, diff, _ = screenshot_compare.compare_with_baseline(
@@ -203,14 +314,14 @@ class TestModalVisualRegression:
 
     @pytest.mark.visual
     @pytest.mark.ui
-    def test_login_modal_visual(self, page: Page, screenshot_compare):
+    def test_login_modal_visual(self, page: Page, screenshot_compare, visual_temp_dir):
         """Test login modal visual consistency."""
         page.goto(settings.base_url)
         page.click("#login2")
         page.wait_for_selector("#logInModal", state="visible")
 
         modal = page.locator("#logInModal")
-        screenshot_path = "visual/temp/login_modal.png"
+        screenshot_path = str(visual_temp_dir / "login_modal.png")
         modal.screenshot(path=screenshot_path)
 
         is_similar, diff, _ = screenshot_compare.compare_with_baseline(
@@ -221,14 +332,14 @@ class TestModalVisualRegression:
 
     @pytest.mark.visual
     @pytest.mark.ui
-    def test_signup_modal_visual(self, page: Page, screenshot_compare):
+    def test_signup_modal_visual(self, page: Page, screenshot_compare, visual_temp_dir):
         """Test signup modal visual consistency."""
         page.goto(settings.base_url)
         page.click("#signin2")
         page.wait_for_selector("#signInModal", state="visible")
 
         modal = page.locator("#signInModal")
-        screenshot_path = "visual/temp/signup_modal.png"
+        screenshot_path = str(visual_temp_dir / "signup_modal.png")
         modal.screenshot(path=screenshot_path)
 
         is_similar, diff, _ = screenshot_compare.compare_with_baseline(
@@ -239,7 +350,7 @@ class TestModalVisualRegression:
 
     @pytest.mark.visual
     @pytest.mark.ui
-    def test_checkout_modal_visual(self, page: Page, screenshot_compare):
+    def test_checkout_modal_visual(self, page: Page, screenshot_compare, visual_temp_dir):
         """Test checkout modal visual consistency."""
         page.goto(settings.base_url)
         page.click("#cartur")
@@ -248,7 +359,7 @@ class TestModalVisualRegression:
         page.wait_for_selector("#orderModal", state="visible")
 
         modal = page.locator("#orderModal")
-        screenshot_path = "visual/temp/checkout_modal.png"
+        screenshot_path = str(visual_temp_dir / "checkout_modal.png")
         modal.screenshot(path=screenshot_path)
 
         is_similar, diff, _ = screenshot_compare.compare_with_baseline(
@@ -264,13 +375,15 @@ class TestCrossBrowserVisualRegression:
     @pytest.mark.visual
     @pytest.mark.ui
     @pytest.mark.parametrize("browser_name", ["chromium", "firefox", "webkit"])
-    def test_homepage_cross_browser(self, page: Page, screenshot_compare, browser_name):
+    def test_homepage_cross_browser(
+        self, page: Page, screenshot_compare, browser_name, visual_temp_dir
+    ):
         """Test homepage consistency across browsers."""
         page.goto(settings.base_url)
-        page.wait_for_load_state("networkidle")
+        _wait_for_visual_ready(page, "#tbodyid .card")
 
-        screenshot_path = f"visual/temp/homepage_{browser_name}.png"
-        page.screenshot(path=screenshot_path, full_page=True)
+        screenshot_path = str(visual_temp_dir / f"homepage_{browser_name}.png")
+        page.screenshot(path=screenshot_path)
 
         is_similar, diff, _ = screenshot_compare.compare_with_baseline(
             screenshot_path, f"homepage_{browser_name}", threshold=0.08
@@ -282,14 +395,16 @@ class TestCrossBrowserVisualRegression:
     @pytest.mark.visual
     @pytest.mark.ui
     @pytest.mark.parametrize("browser_name", ["chromium", "firefox"])
-    def test_login_modal_cross_browser(self, page: Page, screenshot_compare, browser_name):
+    def test_login_modal_cross_browser(
+        self, page: Page, screenshot_compare, browser_name, visual_temp_dir
+    ):
         """Test login modal consistency across browsers."""
         page.goto(settings.base_url)
         page.click("#login2")
         page.wait_for_selector("#logInModal", state="visible")
 
         modal = page.locator("#logInModal")
-        screenshot_path = f"visual/temp/login_{browser_name}.png"
+        screenshot_path = str(visual_temp_dir / f"login_{browser_name}.png")
         modal.screenshot(path=screenshot_path)
 
         is_similar, diff, _ = screenshot_compare.compare_with_baseline(
@@ -313,14 +428,16 @@ class TestResponsiveVisualRegression:
         (1920, 1080, "desktop_hd"),
         (2560, 1440, "desktop_2k"),
     ])
-    def test_homepage_responsive(self, page: Page, screenshot_compare, width, height, name):
+    def test_homepage_responsive(
+        self, page: Page, screenshot_compare, width, height, name, visual_temp_dir
+    ):
         """Test homepage across different viewport sizes."""
         page.set_viewport_size({"width": width, "height": height})
         page.goto(settings.base_url)
-        page.wait_for_load_state("networkidle")
+        _wait_for_visual_ready(page, "#tbodyid .card")
 
-        screenshot_path = f"visual/temp/homepage_{name}.png"
-        page.screenshot(path=screenshot_path, full_page=True)
+        screenshot_path = str(visual_temp_dir / f"homepage_{name}.png")
+        page.screenshot(path=screenshot_path)
 
         is_similar, diff, _ = screenshot_compare.compare_with_baseline(
             screenshot_path, f"homepage_{name}", threshold=0.05
@@ -334,16 +451,19 @@ class TestStateVisualRegression:
 
     @pytest.mark.visual
     @pytest.mark.ui
-    def test_hover_state_product_card(self, page: Page, screenshot_compare):
+    def test_hover_state_product_card(self, page: Page, screenshot_compare, visual_temp_dir):
         """Test product card hover state."""
         page.goto(settings.base_url)
-        page.wait_for_load_state("networkidle")
+        _wait_for_visual_ready(page, "#tbodyid .card")
 
         card = page.locator(".card").first
         card.hover()
-        page.wait_for_timeout(300)
+        # getAnimations() includes CSS transitions, so this waits for the hover effect to finish
+        card.evaluate(
+            "el => Promise.all(el.getAnimations({ subtree: true }).map((a) => a.finished))"
+        )
 
-        screenshot_path = "visual/temp/card_hover.png"
+        screenshot_path = str(visual_temp_dir / "card_hover.png")
         card.screenshot(path=screenshot_path)
 
         is_similar, diff, _ = screenshot_compare.compare_with_baseline(
@@ -354,14 +474,15 @@ class TestStateVisualRegression:
 
     @pytest.mark.visual
     @pytest.mark.ui
-    def test_active_category_visual(self, page: Page, screenshot_compare):
+    def test_active_category_visual(self, page: Page, screenshot_compare, visual_temp_dir):
         """Test active category visual state."""
         page.goto(settings.base_url)
-        page.click("a:has-text('Phones')")
-        page.wait_for_timeout(500)
+        with page.expect_response("**/bycat"):
+            page.click("a:has-text('Phones')")
+        _wait_for_visual_ready(page, "#tbodyid .card")
 
         sidebar = page.locator("#cat")
-        screenshot_path = "visual/temp/active_category.png"
+        screenshot_path = str(visual_temp_dir / "active_category.png")
         sidebar.screenshot(path=screenshot_path)
 
         is_similar, diff, _ = screenshot_compare.compare_with_baseline(
@@ -372,40 +493,53 @@ class TestStateVisualRegression:
 
     @pytest.mark.visual
     @pytest.mark.ui
-    def test_cart_with_items_visual(self, page: Page, screenshot_compare):
-        """Test cart page with items."""
+    def test_product_and_cart_flow(self, page: Page, screenshot_compare, visual_temp_dir):
+        """Test product detail page, then the cart after adding that product."""
         page.goto(settings.base_url)
-        page.wait_for_load_state("networkidle")
 
-        # Add item to cart
-        page.click(".card-title a >> nth=0")
-        page.wait_for_selector("#tbodyid")
-        page.click("a:has-text('Add to cart')")
-        page.wait_for_timeout(500)
+        # Product page
+        page.locator(".card-title a").first.click()
+        _wait_for_visual_ready(page, "#tbodyid .name")
 
-        # Go to cart
-        page.click("#cartur")
-        page.wait_for_selector("#tbodyid")
+        product_path = str(visual_temp_dir / "product_page.jpg")
+        page.screenshot(path=product_path, full_page=True, type="jpeg", quality=90)
+        product_similar, product_diff, _ = screenshot_compare.compare_with_baseline(
+            product_path, "product_page", threshold=0.05
+        )
 
-        screenshot_path = "visual/temp/cart_with_items.png"
-        page.screenshot(path=screenshot_path, full_page=True)
+        # Add the same product to cart
+        # The confirmation alert only appears once the item is saved server-side
+        with page.expect_event("dialog") as dialog_info:
+            page.click("a:has-text('Add to cart')")
+        dialog_info.value.accept()
 
-        is_similar, diff, _ = screenshot_compare.compare_with_baseline(
-            screenshot_path, "cart_with_items", threshold=0.05
+        page.click("#cartur")
+        page.wait_for_selector("#tbodyid tr")
+
+        cart_path = str(visual_temp_dir / "cart_with_items.png")
+        page.screenshot(path=cart_path)
+        cart_similar, cart_diff, _ = screenshot_compare.compare_with_baseline(
+            cart_path, "cart_with_items", threshold=0.05
         )
 
-        assert is_similar, f"Cart with items diff: {diff:.2%}"
+        # Both baselines are compared before asserting so each regression is reported
+        failures = []
+        if not product_similar:
+            failures.append(f"Product page regression: {product_diff:.2%} difference")
+        if not cart_similar:
+            failures.append(f"Cart with items diff: {cart_diff:.2%}")
+        assert not failures, "; ".join(failures)
 
     @pytest.mark.visual
     @pytest.mark.ui
-    def test_empty_cart_visual(self, page: Page, screenshot_compare):
+    def test_empty_cart_visual(self, page: Page, screenshot_compare, visual_temp_dir):
         """Test empty cart visual state."""
         page.goto(settings.base_url)
         page.click("#cartur")
         page.wait_for_selector("#tbodyid")
 
-        screenshot_path = "visual/temp/empty_cart.png"
-        page.screenshot(path=screenshot_path, full_page=True)
+        screenshot_path = str(visual_temp_dir / "empty_cart.png")
+        page.screenshot(path=screenshot_path)
 
         is_similar, diff, _ = screenshot_compare.compare_with_baseline(
             screenshot_path, "empty_cart", threshold=0.03
@@ -419,27 +553,29 @@ class TestLoadingStateVisualRegression:
 
     @pytest.mark.visual
     @pytest.mark.ui
-    def test_page_skeleton_visual(self, page: Page, screenshot_compare):
+    @pytest.mark.skip(reason="Documentation-only; captures a screenshot without asserting")
+    def test_page_skeleton_visual(self, page: Page, screenshot_compare, visual_temp_dir):
         """Test page loading skeleton/spinner."""
         page.goto(settings.base_url)
         # Capture immediately (might catch loading state)
         
-        screenshot_path = "visual/temp/loading_state.png"
+        screenshot_path = str(visual_temp_dir / "loading_state.png")
         page.screenshot(path=screenshot_path)
 
         # This test documents the loading state visual
 
     @pytest.mark.visual
     @pytest.mark.ui
-    def test_modal_transition_visual(self, page: Page, screenshot_compare):
+    @pytest.mark.skip(reason="Documentation-only; captures a screenshot without asserting")
+    def test_modal_transition_visual(self, page: Page, screenshot_compare, visual_temp_dir):
         """Test modal opening transition."""
         page.goto(settings.base_url)
         
         # Click and immediately capture
         page.click("#login2")
-        page.wait_for_timeout(100)  # Mid-transition
+        page.wait_for_selector("#logInModal.show")
 
-        screenshot_path = "visual/temp/modal_transition.png"
+        screenshot_path = str(visual_temp_dir / "modal_transition.png")
         page.screenshot(path=screenshot_path)
 
         # Documents transition state
@@ -451,12 +587,12 @@ class TestDarkModeVisualRegression:
     @pytest.mark.visual
     @pytest.mark.ui
     @pytest.mark.skip(reason="Dark mode not supported by DemoBlaze")
-    def test_homepage_dark_mode(self, page: Page, screenshot_compare):
+    def test_homepage_dark_mode(self, page: Page, screenshot_compare, visual_temp_dir):
         """Test homepage in dark mode."""
         # Inject dark mode styles or toggle if supported
         page.goto(settings.base_url)
         
-        screenshot_path = "visual/temp/homepage_dark.png"
+        screenshot_path = str(visual_temp_dir / "homepage_dark.png")
         page.screenshot(path=screenshot_path, full_page=True)
 
         is_similar, diff, _ = screenshot_compare.compare_with_baseline(
@@ -5,16 +5,112 @@ Provides image comparison, diff generation, and threshold management
 for detecting visual regressions across browsers and viewports.
 """
 
+import hashlib
+import io
+import operator
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
-from PIL import Image, ImageChops, ImageDraw
+from PIL import Image, ImageChops, ImageDraw, ImageFilter
+
+# Channel value of each bin in an RGB image's 768-entry histogram
+_RGB_BIN_VALUES = list(range(256)) * 3
+
+# Every Nth row and column is sampled for the fail-fast difference estimate, which
+# must exceed the threshold by this factor before the full comparison is skipped
+_SAMPLE_STRIDE = 8
+_SAMPLE_REJECT_FACTOR = 4
+
+# Decoded baselines kept in memory; a session compares a handful of full-page screenshots
+_BASELINE_CACHE_SIZE = 8
+
+# Lookup table amplifying diff images tenfold, saturating at 255, for all three RGB bands
+_DIFF_ENHANCE_LUT = [min(value * 10, 255) for value in range(256)] * 3
+
+
+def _open_image(path: str) -> Image.Image:
+    """Open an image from a single read of its file, leaving no file handle open.
+
+    Only the header is parsed here; pixels are decoded on first use.
+
+    Args:
+        path: Path to image
+
+    Returns:
+        Lazily decoded image
+    """
+    return Image.open(io.BytesIO(Path(path).read_bytes()))
+
+
+def _as_rgb(img: Image.Image) -> Image.Image:
+    """Decode an opened image as RGB.
+
+    Playwright screenshots are already RGB; those are decoded in place rather
+    than duplicated by ``convert("RGB")``.
+
+    Args:
+        img: Opened image
+
+    Returns:
+        Decoded RGB image
+    """
+    if img.mode != "RGB":
+        return img.convert("RGB")
+    img.load()
+    return img
+
+
+def _open_rgb(path: str) -> Image.Image:
+    """Decode an image file as RGB.
+
+    Args:
+        path: Path to image
+
+    Returns:
+        Decoded RGB image
+    """
+    return _as_rgb(_open_image(path))
+
+
+@lru_cache(maxsize=_BASELINE_CACHE_SIZE)
+def _load_rgb_image(path: str, mtime_ns: int) -> Image.Image:
+    """Decode an image as RGB, memoized per path and modification time.
+
+    The returned image is shared between callers and must not be modified.
+
+    Args:
+        path: Path to image
+        mtime_ns: File modification time, so a rewritten file is decoded again
+
+    Returns:
+        Decoded RGB image
+    """
+    img = _open_rgb(path)
+    # Pixels are decoded; drop the encoded file bytes so the cache holds only the image
+    img.fp = None
+    return img
+
+
+def _load_cached_rgb_image(path: str) -> Image.Image:
+    """Get an image's shared decoded RGB copy, decoding it again only if the file changed.
+
+    Args:
+        path: Path to image
+
+    Returns:
+        Decoded RGB image; callers must not modify it
+    """
+    return _load_rgb_image(path, os.stat(path).st_mtime_ns)
 
 
 class ScreenshotCompare:
     """Utility for comparing screenshots and detecting visual differences."""
 
+    __slots__ = ("baseline_dir", "diff_dir")
+
     def __init__(self, baseline_dir: str = "visual/baselines", diff_dir: str = "visual/diffs"):
         """Initialize screenshot comparison utility.
 
@@ -32,7 +128,8 @@ class ScreenshotCompare:
         image1_path: str,
         image2_path: str,
         threshold: float = 0.1,
-        ignore_antialiasing: bool = True
+        ignore_antialiasing: bool = False,
+        fail_fast: bool = False
     ) -> Tuple[bool, float]:
         """Compare two images and return similarity result.
 
@@ -40,30 +137,88 @@ class ScreenshotCompare:
             image1_path: Path to first image (baseline)
             image2_path: Path to second image (current)
             threshold: Acceptable difference threshold (0.0-1.0)
-            ignore_antialiasing: Whether to ignore minor pixel differences
+            ignore_antialiasing: Whether to ignore differences narrower than 3px
+                (including thin text changes), such as antialiased edges. Off by
+                default, matching compare_with_baseline, which never filters
+            fail_fast: Reject clearly different images from a strided sample. The
+                returned difference is then the sample's estimate, not the exact value
 
         Returns:
             Tuple of (is_similar, difference_percentage)
         """
-        img1 = Image.open(image1_path).convert("RGB")
-        img2 = Image.open(image2_path).convert("RGB")
+        img1 = _load_cached_rgb_image(image1_path)
+        img2 = _open_rgb(image2_path)
+        return self._compare_loaded(img1, img2, threshold, ignore_antialiasing, fail_fast)
+
+    @staticmethod
+    def _compare_loaded(
+        img1: Image.Image,
+        img2: Image.Image,
+        threshold: float,
+        ignore_antialiasing: bool = False,
+        fail_fast: bool = False
+    ) -> Tuple[bool, float]:
+        """Compare two decoded RGB images.
 
+        Args:
+            img1: First image (baseline)
+            img2: Second image (current)
+            threshold: Acceptable difference threshold (0.0-1.0)
+            ignore_antialiasing: Whether to ignore differences narrower than 3px
+                (including thin text changes)
+            fail_fast: Whether a clear failure may be reported from the sampled estimate
+
+        Returns:
+            Tuple of (is_similar, difference_percentage)
+        """
         # Ensure images are same size
         if img1.size != img2.size:
             return False, 1.0
 
-        # Calculate pixel-by-pixel difference
-        diff = ImageChops.difference(img1, img2)
-        
-        # Calculate difference percentage
-        diff_pixels = sum(sum(pixel) for pixel in diff.getdata())
-        total_pixels = img1.size[0] * img1.size[1] * 3 * 255  # RGB * max_value
-        difference = diff_pixels / total_pixels
+        # A clear failure shows up in a strided sample; the caller opted into its estimate.
+        # Sampling breaks up pixel neighbourhoods, so it cannot honour ignore_antialiasing.
+        if fail_fast and not ignore_antialiasing:
+            sample_size = (
+                max(1, img1.width // _SAMPLE_STRIDE),
+                max(1, img1.height // _SAMPLE_STRIDE),
+            )
+            estimate = ScreenshotCompare._difference(
+                img1.resize(sample_size, Image.Resampling.NEAREST),
+                img2.resize(sample_size, Image.Resampling.NEAREST),
+            )
+            if estimate > threshold * _SAMPLE_REJECT_FACTOR:
+                return False, estimate
 
+        difference = ScreenshotCompare._difference(img1, img2, ignore_antialiasing)
         is_similar = difference <= threshold
 
         return is_similar, difference
 
+    @staticmethod
+    def _difference(
+        img1: Image.Image, img2: Image.Image, ignore_antialiasing: bool = False
+    ) -> float:
+        """Get the mean absolute channel difference of two same-size RGB images.
+
+        Args:
+            img1: First image
+            img2: Second image
+            ignore_antialiasing: Whether to erode the diff with a 3x3 minimum filter,
+                which drops differences narrower than 3px (including thin text changes)
+
+        Returns:
+            Difference as a fraction of the maximum (0.0-1.0)
+        """
+        # Calculate pixel-by-pixel difference
+        diff = ImageChops.difference(img1, img2)
+        if ignore_antialiasing:
+            diff = diff.filter(ImageFilter.MinFilter(3))
+
+        # Calculate difference percentage from the C-computed histogram (768 bins)
+        diff_pixels = sum(map(operator.mul, diff.histogram(), _RGB_BIN_VALUES))
+        total_pixels = img1.size[0] * img1.size[1] * 3 * 255  # RGB * max_value
+        return diff_pixels / total_pixels
+
     def create_diff_image(
         self,
         baseline_path: str,
@@ -77,9 +232,21 @@ class ScreenshotCompare:
             current_path: Path to current image
             output_path: Path to save diff image
         """
-        baseline = Image.open(baseline_path).convert("RGB")
-        current = Image.open(current_path).convert("RGB")
+        self._write_diff_image(
+            _load_cached_rgb_image(baseline_path), _open_rgb(current_path), output_path
+        )
 
+    @staticmethod
+    def _write_diff_image(
+        baseline: Image.Image, current: Image.Image, output_path: str
+    ) -> None:
+        """Write a baseline/current/diff triptych from already decoded RGB images.
+
+        Args:
+            baseline: Baseline image
+            current: Current image
+            output_path: Path to save diff image
+        """
         if baseline.size != current.size:
             # Resize current to match baseline
             current = current.resize(baseline.size)
@@ -88,7 +255,7 @@ class ScreenshotCompare:
         diff = ImageChops.difference(baseline, current)
 
         # Enhance difference for visibility
-        diff = diff.point(lambda x: x * 10)
+        diff = diff.point(_DIFF_ENHANCE_LUT)
 
         # Create side-by-side comparison
         width = baseline.size[0] * 3
@@ -104,7 +271,8 @@ class ScreenshotCompare:
         draw = ImageDraw.Draw(comparison)
         # Labels would need a font, skipping for simplicity
 
-        comparison.save(output_path)
+        # Diff images are throwaway debugging output; favour encode speed over size
+        comparison.save(output_path, compress_level=1)
 
     def save_baseline(self, screenshot_path: str, name: str) -> str:
         """Save a screenshot as baseline.
@@ -117,16 +285,62 @@ class ScreenshotCompare:
             Path to saved baseline
         """
         baseline_path = self.baseline_dir / f"{name}.png"
-        img = Image.open(screenshot_path)
-        img.save(baseline_path)
+        data = Path(screenshot_path).read_bytes()
+        Image.open(io.BytesIO(data)).save(baseline_path)
+        # Re-encoding changes the bytes, so record the digest of the capture itself,
+        # plus the saved PNG's so a baseline replaced by hand invalidates the sidecar
+        png_digest = self._digest(baseline_path.read_bytes())
+        self._digest_path(name).write_text(f"{self._digest(data)} {png_digest}\n")
         return str(baseline_path)
 
+    def _load_baseline(self, name: str) -> Image.Image:
+        """Get a baseline's decoded RGB image, decoding it at most once per file version.
+
+        Args:
+            name: Baseline name
+
+        Returns:
+            Shared decoded image; callers must not modify it
+        """
+        return _load_cached_rgb_image(str(self.baseline_dir / f"{name}.png"))
+
+    def _digest_path(self, name: str) -> Path:
+        """Get the path of a baseline's sidecar file (capture and PNG SHA-256 digests)."""
+        return self.baseline_dir / f"{name}.sha256"
+
+    @staticmethod
+    def _digest(data: bytes) -> str:
+        """Get the SHA-256 hex digest of a file's bytes."""
+        return hashlib.sha256(data).hexdigest()
+
+    def _matches_baseline_digest(self, data: bytes, name: str) -> bool:
+        """Check if a screenshot is byte-identical to the capture the baseline came from.
+
+        Args:
+            data: Bytes of the current screenshot file
+            name: Baseline name
+
+        Returns:
+            True if the sidecar matches both the screenshot and the current baseline PNG
+        """
+        try:
+            capture_digest, png_digest = self._digest_path(name).read_text().split()
+        except (FileNotFoundError, ValueError):
+            # Missing, or written by an older version without the PNG digest
+            return False
+        if capture_digest != self._digest(data):
+            return False
+        # A baseline PNG replaced without regenerating its sidecar gets a full compare
+        baseline_data = (self.baseline_dir / f"{name}.png").read_bytes()
+        return png_digest == self._digest(baseline_data)
+
     def compare_with_baseline(
         self,
         screenshot_path: str,
         name: str,
         threshold: float = 0.1,
-        save_diff: bool = True
+        save_diff: bool = True,
+        fail_fast: bool = False
     ) -> Tuple[bool, float, Optional[str]]:
         """Compare screenshot with baseline.
 
@@ -135,6 +349,8 @@ class ScreenshotCompare:
             name: Baseline name
             threshold: Acceptable difference threshold
             save_diff: Whether to save diff image
+            fail_fast: Reject clearly different images from a strided sample. The
+                returned difference is then the sample's estimate, not the exact value
 
         Returns:
             Tuple of (is_similar, difference, diff_path)
@@ -146,23 +362,65 @@ class ScreenshotCompare:
             self.save_baseline(screenshot_path, name)
             return True, 0.0, None
 
-        is_similar, difference = self.compare_images(
-            str(baseline_path),
-            screenshot_path,
-            threshold
+        # The capture is read once; both the digest check and the decode use these bytes
+        data = Path(screenshot_path).read_bytes()
+
+        # Identical bytes need no pixel diff
+        if self._matches_baseline_digest(data, name):
+            return True, 0.0, None
+
+        baseline = self._load_baseline(name)
+        current = Image.open(io.BytesIO(data))
+        # The size comes from the file header, so a resized page is rejected undecoded
+        if current.size != baseline.size and not save_diff:
+            return False, 1.0, None
+
+        current_rgb = _as_rgb(current)
+        is_similar, difference = self._compare_loaded(
+            baseline, current_rgb, threshold, fail_fast=fail_fast
         )
 
         diff_path = None
         if not is_similar and save_diff:
             diff_path = self.diff_dir / f"{name}_diff.png"
-            self.create_diff_image(
-                str(baseline_path),
-                screenshot_path,
-                str(diff_path)
-            )
+            # Reuse the decoded images rather than reading both files again
+            self._write_diff_image(baseline, current_rgb, str(diff_path))
 
         return is_similar, difference, str(diff_path) if diff_path else None
 
+    def compare_batch(
+        self,
+        comparisons: List[Tuple[str, str]],
+        threshold: float = 0.1,
+        save_diff: bool = True,
+        max_workers: Optional[int] = None,
+        fail_fast: bool = False
+    ) -> List[Tuple[bool, float, Optional[str]]]:
+        """Compare several screenshots with their baselines concurrently.
+
+        Pillow releases the GIL while decoding and diffing, so threads run the
+        comparisons in parallel and share the decoded-baseline cache.
+
+        Args:
+            comparisons: List of (screenshot_path, baseline_name) pairs
+            threshold: Acceptable difference threshold
+            save_diff: Whether to save diff images
+            max_workers: Maximum number of threads (defaults to executor default)
+            fail_fast: Passed to compare_with_baseline; differences may then be estimates
+
+        Returns:
+            List of (is_similar, difference, diff_path) in input order
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda pair: self.compare_with_baseline(
+                        pair[0], pair[1], threshold, save_diff, fail_fast
+                    ),
+                    comparisons,
+                )
+            )
+
     def update_baseline(self, screenshot_path: str, name: str) -> str:
         """Update baseline with new screenshot.
 
@@ -193,58 +451,45 @@ class ScreenshotCompare:
         Returns:
             Tuple of (is_similar, difference)
         """
-        img1 = Image.open(image1_path).convert("RGB")
-        img2 = Image.open(image2_path).convert("RGB")
-
-        # Crop to region
-        region1 = img1.crop(region)
-        region2 = img2.crop(region)
+        img1 = _load_cached_rgb_image(image1_path)
+        img2 = _open_rgb(image2_path)
 
-        # Save temporary cropped images
-        temp_path1 = self.diff_dir / "temp_region1.png"
-        temp_path2 = self.diff_dir / "temp_region2.png"
-
-        region1.save(temp_path1)
-        region2.save(temp_path2)
-
-        # Compare regions
-        result = self.compare_images(
-            str(temp_path1),
-            str(temp_path2),
-            threshold
-        )
-
-        # Cleanup temp files
-        temp_path1.unlink()
-        temp_path2.unlink()
-
-        return result
+        # Crop to region and compare in memory
+        return self._compare_loaded(img1.crop(region), img2.crop(region), threshold)
 
     def get_image_hash(self, image_path: str) -> str:
-        """Get perceptual hash of image for quick comparison.
+        """Get perceptual (average) hash of image for quick comparison.
 
         Args:
             image_path: Path to image
 
         Returns:
-            Image hash string
+            64-bit hash as 16 hex characters; compare hashes with hamming_distance()
         """
-        import hashlib
+        # Convert to grayscale first so the resize filters one channel instead of three;
+        # at 8x8 a bilinear filter loses nothing a Lanczos one would keep
+        img = _open_image(image_path).convert("L").resize((8, 8), Image.Resampling.BILINEAR)
 
-        img = Image.open(image_path)
-        # Resize to small size for hash
-        img = img.resize((8, 8), Image.Resampling.LANCZOS).convert("L")
-        
         # Get average pixel value
-        pixels = list(img.getdata())
-        avg = sum(pixels) / len(pixels)
+        avg = sum(img.getdata()) / (img.width * img.height)
+
+        # Threshold into a 1-bit image; its bytes are the pixels vs average, packed MSB first
+        bits = img.point(lambda pixel: 255 if pixel > avg else 0, mode="1").tobytes()
 
-        # Create hash based on pixels vs average
-        bits = "".join("1" if pixel > avg else "0" for pixel in pixels)
-        
-        # Convert to hex
-        hash_int = int(bits, 2)
-        return hashlib.md5(str(hash_int).encode()).hexdigest()
+        return bits.hex()
+
+    @staticmethod
+    def hamming_distance(hash1: str, hash2: str) -> int:
+        """Count the bits that differ between two image hashes.
+
+        Args:
+            hash1: Hash from get_image_hash
+            hash2: Hash from get_image_hash
+
+        Returns:
+            Number of differing bits (0 means perceptually near-identical)
+        """
+        return (int(hash1, 16) ^ int(hash2, 16)).bit_count()
 
     def clear_diffs(self) -> None:
         """Clear all diff images."""
@@ -255,3 +500,6 @@ class ScreenshotCompare:
         """Clear all baseline images."""
         for baseline_file in self.baseline_dir.glob("*.png"):
             baseline_file.unlink()
+        for digest_file in self.baseline_dir.glob("*.sha256"):
+            digest_file.unlink()
+        _load_rgb_image.cache_clear()